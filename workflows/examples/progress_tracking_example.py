@@ -9,42 +9,91 @@ Usage:
 """
 
 import asyncio
+import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Awaitable, Callable
 
 from browser_use.llm import ChatBrowserUse
+from scripts.deterministic._deterministic_common import run_async
 
-from workflow_use.healing.service import HealingService
+from workflow_use.healing.service import HealingService, _start_task
+
+
+@dataclass(slots=True)
+class RecordedStep:
+	"""A stored copy of the step data passed to on_step_recorded."""
+
+	step_number: int
+	action_type: str
+	description: str
+	url: str
+	selector: str | None = None
+	extracted_data: Any = None
+	timestamp: str = ''
+	target_text: str | None = None
+
+
+@dataclass(slots=True)
+class StatusEntry:
+	"""A stored status update; `timestamp` is a raw time.time() reading."""
+
+	timestamp: float
+	message: str
+
+
+_RULE = '=' * 80
+
+
+def _print_header(title: str, leading_newline: bool = True) -> None:
+	"""Write a section banner in a single stdout write."""
+	sys.stdout.write(('\n' if leading_newline else '') + f'{_RULE}\n{title}\n{_RULE}\n')
+
+
+# Every state of the 10-cell progress bar, indexed by completed step count
+_BARS = tuple('█' * i + '░' * (10 - i) for i in range(11))
+
+
+async def _consume(queue: asyncio.Queue, handlers: dict[str, Callable[[Any], Awaitable[None]]]):
+	"""Drain `(kind, payload)` callback events from `queue` in one long-lived task.
+
+	HealingService fires its callbacks synchronously, so they only enqueue;
+	this avoids spawning a fire-and-forget task per step or status event.
+	"""
+	while True:
+		kind, payload = await queue.get()
+		try:
+			await handlers[kind](payload)
+		except Exception as e:
+			# Keep consuming: if this task ended, nothing would drain the queue and queue.join() would never return
+			print(f'⚠️  Warning: {kind} handler failed: {e}')
+		finally:
+			queue.task_done()
 
 
 # Example 1: Simple console logging
-async def simple_console_example():
+async def simple_console_example(healing_service: HealingService, llm: ChatBrowserUse):
 	"""Basic example: Print steps to console as they're recorded."""
-	print('=' * 80)
-	print('EXAMPLE 1: Simple Console Logging')
-	print('=' * 80)
+	_print_header('EXAMPLE 1: Simple Console Logging', leading_newline=False)
 
 	def step_callback(step_data: dict):
 		"""Called each time a step is recorded."""
+		target_text = step_data.get('target_text')
+		extracted_data = step_data.get('extracted_data')
+
 		print(f'\n📍 Step {step_data["step_number"]}: {step_data["description"]}')
 		print(f'   Type: {step_data["action_type"]}')
 		print(f'   URL: {step_data["url"]}')
-		if step_data.get('target_text'):
-			print(f'   Target: {step_data["target_text"]}')
-		if step_data.get('extracted_data'):
-			print(f'   Extracted: {step_data["extracted_data"]}')
+		if target_text:
+			print(f'   Target: {target_text}')
+		if extracted_data:
+			print(f'   Extracted: {extracted_data}')
 
 	def status_callback(status: str):
 		"""Called for general status updates."""
 		print(f'\n🔄 {status}')
 
-	# Initialize service
-	llm = ChatBrowserUse(model='bu-latest')
-	healing_service = HealingService(
-		llm=llm,
-		use_deterministic_conversion=True,
-		enable_variable_extraction=True,
-	)
-
 	# Generate workflow with callbacks
 	workflow = await healing_service.generate_workflow_from_prompt(
 		prompt='Go to example.com and extract the page title',
@@ -58,84 +107,77 @@ async def simple_console_example():
 	print(f'\n✅ Generated workflow with {len(workflow.steps)} steps!')
 
 
-# Example 2: Store steps in a list (for database storage)
-async def database_storage_example():
-	"""Example: Store steps in memory (simulates database storage)."""
-	print('\n' + '=' * 80)
-	print('EXAMPLE 2: Database Storage Pattern')
-	print('=' * 80)
+# Example 2: Stream steps to storage (for database storage)
+async def database_storage_example(healing_service: HealingService, llm: ChatBrowserUse):
+	"""Example: Stream steps to storage as they arrive (simulates database storage)."""
+	_print_header('EXAMPLE 2: Database Storage Pattern')
 
-	# Simulated database storage
-	stored_steps = []
-	status_history = []
+	# Simulated database storage: each record is written as it arrives and not kept
+	# in memory, so only running counts are held for the summary
+	step_count = 0
+	status_count = 0
 
 	async def step_callback(step_data: dict):
-		"""Store step in database (simulated with list)."""
-		stored_steps.append(step_data)
-		print(f'✓ Stored step {step_data["step_number"]} in database')
+		"""Store step in database (simulated with a print)."""
+		nonlocal step_count
+		step = RecordedStep(**step_data)
+		step_count += 1
+		print(f'✓ Stored step {step.step_number} in database: {step.description}')
 
 	async def status_callback(status: str):
 		"""Store status update in database."""
-		status_history.append({'timestamp': datetime.now().isoformat(), 'status': status})
-		print(f'ℹ️  {status}')
-
-	# Initialize service
-	llm = ChatBrowserUse(model='bu-latest')
-	healing_service = HealingService(
-		llm=llm,
-		use_deterministic_conversion=True,
-		enable_variable_extraction=True,
-	)
-
-	# Generate workflow with async callbacks
-	workflow = await healing_service.generate_workflow_from_prompt(
-		prompt='Go to example.com and extract the page title',
-		agent_llm=llm,
-		extraction_llm=llm,
-		use_cloud=False,
-		on_step_recorded=lambda data: asyncio.create_task(step_callback(data)),
-		on_status_update=lambda status: asyncio.create_task(status_callback(status)),
-	)
-
-	# Display stored data
-	print(f'\n📊 Stored {len(stored_steps)} steps and {len(status_history)} status updates')
-	print('\nStored Steps:')
-	for step in stored_steps:
-		print(f'  {step["step_number"]}. {step["description"]}')
-
-	print('\nStatus History:')
-	for status in status_history:
-		print(f'  [{status["timestamp"]}] {status["status"]}')
+		nonlocal status_count
+		entry = StatusEntry(time.time(), status)
+		status_count += 1
+		print(f'ℹ️  [{datetime.fromtimestamp(entry.timestamp).isoformat()}] {entry.message}')
+
+	# Generate workflow with async callbacks, processed by a single consumer task
+	queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+	consumer = _start_task(_consume(queue, {'step': step_callback, 'status': status_callback}))
+	try:
+		workflow = await healing_service.generate_workflow_from_prompt(
+			prompt='Go to example.com and extract the page title',
+			agent_llm=llm,
+			extraction_llm=llm,
+			use_cloud=False,
+			on_step_recorded=lambda data: queue.put_nowait(('step', data)),
+			on_status_update=lambda status: queue.put_nowait(('status', status)),
+		)
+		await queue.join()
+	finally:
+		consumer.cancel()
+		await asyncio.gather(consumer, return_exceptions=True)
+
+	# Display summary
+	print(f'\n📊 Stored {step_count} steps and {status_count} status updates')
+	print(f'✅ Generated workflow with {len(workflow.steps)} steps!')
 
 
 # Example 3: Real-time progress bar
-async def progress_bar_example():
+async def progress_bar_example(healing_service: HealingService, llm: ChatBrowserUse):
 	"""Example: Show progress with a simple progress indicator."""
-	print('\n' + '=' * 80)
-	print('EXAMPLE 3: Progress Bar')
-	print('=' * 80)
+	_print_header('EXAMPLE 3: Progress Bar')
 
-	step_count = {'count': 0}
-
-	def step_callback(step_data: dict):
+	def tty_step_callback(step_data: dict):
 		"""Update progress bar as steps are recorded."""
-		step_count['count'] = step_data['step_number']
+		step_number = step_data['step_number']
 		# Simple progress indicator
-		bar = '█' * step_data['step_number'] + '░' * (10 - step_data['step_number'])
-		print(f'\rProgress: [{bar}] Step {step_data["step_number"]}: {step_data["description"][:40]}...', end='')
+		bar = _BARS[min(step_number, 10)]
+		print(f'\rProgress: [{bar}] Step {step_number}: {step_data["description"][:40]}...', end='')
+
+	def log_step_callback(step_data: dict):
+		"""Log every 10th step when output is not a terminal (CI logs, redirected files)."""
+		step_number = step_data['step_number']
+		if step_number % 10 == 0:
+			print(f'Step {step_number}')
+
+	# A \r-redrawn bar only makes sense on a terminal
+	step_callback = tty_step_callback if sys.stdout.isatty() else log_step_callback
 
 	def status_callback(status: str):
 		"""Display status updates."""
 		print(f'\n\n🔄 {status}')
 
-	# Initialize service
-	llm = ChatBrowserUse(model='bu-latest')
-	healing_service = HealingService(
-		llm=llm,
-		use_deterministic_conversion=True,
-		enable_variable_extraction=True,
-	)
-
 	# Generate workflow with callbacks
 	workflow = await healing_service.generate_workflow_from_prompt(
 		prompt='Go to example.com and extract the page title',
@@ -146,111 +188,117 @@ async def progress_bar_example():
 		on_status_update=status_callback,
 	)
 
-	print(f'\n\n✅ Completed! Generated workflow with {step_count["count"]} steps')
+	print(f'\n\n✅ Completed! Generated workflow with {len(workflow.steps)} steps')
 
 
 # Example 4: Real-world pattern for Browser-Use Cloud backend
-async def cloud_backend_pattern():
+async def cloud_backend_pattern(healing_service: HealingService, llm: ChatBrowserUse):
 	"""
 	Example: Pattern for Browser-Use Cloud backend integration.
 
 	This shows how to integrate with your database to store steps
 	in real-time for frontend polling.
 	"""
-	print('\n' + '=' * 80)
-	print('EXAMPLE 4: Browser-Use Cloud Backend Pattern')
-	print('=' * 80)
+	_print_header('EXAMPLE 4: Browser-Use Cloud Backend Pattern')
 
 	# Simulated workflow_id (would come from your database)
 	workflow_id = 'wf_123abc'
-	generation_metadata = {'steps': [], 'status_history': []}
+	generation_metadata: dict[str, list] = {'steps': [], 'status_history': []}
 
-	async def step_callback(step_data: dict):
+	async def store_steps(rows: list[dict]):
 		"""
-		Store step immediately in database for real-time display.
+		Store a batch of steps in the database for real-time display.
 
-		In your actual implementation, this would be:
+		In your actual implementation, this would be a single transaction:
 		async with await database.get_session() as session:
-		    workflow = await get_workflow(session, workflow_id)
-		    if workflow and workflow.generation_metadata:
-		        steps = workflow.generation_metadata.get('steps', [])
-		        steps.append(step_data)
-		        workflow.generation_metadata['steps'] = steps
-		        await session.commit()
+		    await session.execute(insert(Step), [{'workflow_id': workflow_id, **row} for row in rows])
+		    await session.commit()
 		"""
-		# Simulated database storage
-		generation_metadata['steps'].append(step_data)
+		# Simulated bulk insert
+		generation_metadata['steps'].extend(RecordedStep(**row) for row in rows)
 
-		print(f'💾 Stored step {step_data["step_number"]} to workflow {workflow_id}')
-		print(f'   Description: {step_data["description"]}')
-		print(f'   Type: {step_data["action_type"]}')
-		print(f'   Timestamp: {step_data["timestamp"]}')
+		print(f'💾 Stored {len(rows)} step(s) to workflow {workflow_id}')
+		for step_data in rows:
+			print(f'   Step {step_data["step_number"]}: {step_data["description"]}')
+			print(f'   Type: {step_data["action_type"]}')
+			print(f'   Timestamp: {step_data["timestamp"]}')
 
 	async def status_callback(status: str):
 		"""Store status updates for display in the frontend."""
-		status_entry = {'timestamp': datetime.now().isoformat(), 'message': status}
-		generation_metadata['status_history'].append(status_entry)
+		generation_metadata['status_history'].append(StatusEntry(time.time(), status))
 
 		print(f'ℹ️  Status update: {status}')
 
-	# Initialize service
-	llm = ChatBrowserUse(model='bu-latest')
-	healing_service = HealingService(
-		llm=llm,
-		use_deterministic_conversion=True,
-		enable_variable_extraction=True,
-	)
-
 	# Generate workflow with progress tracking
 	print(f'\n🚀 Starting workflow generation for {workflow_id}...')
 
-	workflow = await healing_service.generate_workflow_from_prompt(
-		prompt='Go to example.com and extract the page title',
-		agent_llm=llm,
-		extraction_llm=llm,
-		use_cloud=False,
-		on_step_recorded=lambda data: asyncio.create_task(step_callback(data)),
-		on_status_update=lambda status: asyncio.create_task(status_callback(status)),
-	)
+	queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+	consumer = _start_task(_consume(queue, {'status': status_callback}))
+	try:
+		# Steps arrive in batches: one store_steps call per 25 steps, or per 0.2s for a partial batch
+		workflow = await healing_service.generate_workflow_from_prompt(
+			prompt='Go to example.com and extract the page title',
+			agent_llm=llm,
+			extraction_llm=llm,
+			use_cloud=False,
+			on_step_recorded=store_steps,
+			on_status_update=lambda status: queue.put_nowait(('status', status)),
+			batch_size=25,
+			flush_interval=0.2,
+		)
+		await queue.join()
+	finally:
+		consumer.cancel()
+		await asyncio.gather(consumer, return_exceptions=True)
 
 	# Display final metadata (what would be in your database)
-	print('\n' + '=' * 80)
-	print('FINAL DATABASE STATE')
-	print('=' * 80)
+	_print_header('FINAL DATABASE STATE')
 	print(f'\nWorkflow ID: {workflow_id}')
 	print(f'Total Steps Recorded: {len(generation_metadata["steps"])}')
 	print(f'Total Status Updates: {len(generation_metadata["status_history"])}')
 
 	print('\n📋 Steps Timeline:')
 	for step in generation_metadata['steps']:
-		print(f'  [{step["timestamp"]}] Step {step["step_number"]}: {step["description"]}')
+		print(f'  [{step.timestamp}] Step {step.step_number}: {step.description}')
 
 	print('\n📊 Status Timeline:')
 	for status in generation_metadata['status_history']:
-		print(f'  [{status["timestamp"]}] {status["message"]}')
+		print(f'  [{datetime.fromtimestamp(status.timestamp).isoformat()}] {status.message}')
 
 	print(f'\n✅ Workflow generation complete! Final workflow has {len(workflow.steps)} steps')
 
 
+def _create_service() -> tuple[ChatBrowserUse, HealingService]:
+	"""Build the LLM client and HealingService once for every example."""
+	llm = ChatBrowserUse(model='bu-latest')
+	healing_service = HealingService(
+		llm=llm,
+		use_deterministic_conversion=True,
+		enable_variable_extraction=True,
+	)
+	return llm, healing_service
+
+
 # Run all examples
 async def main():
 	"""Run all examples (commented out to avoid actual API calls)."""
 	print('Progress Tracking Examples')
-	print('=' * 80)
+	print(_RULE)
 	print('\nThese examples demonstrate different patterns for tracking')
 	print('workflow generation progress in real-time.')
 	print('\nNote: Examples are commented out to avoid actual API calls.')
 	print('Uncomment the examples you want to run.\n')
 
-	# Uncomment the examples you want to run:
+	# Uncomment the examples you want to run. They share one LLM client and service:
+	# llm, healing_service = _create_service()
 
-	# await simple_console_example()
-	# await database_storage_example()
-	# await progress_bar_example()
-	# await cloud_backend_pattern()
+	# await simple_console_example(healing_service, llm)
+	# await database_storage_example(healing_service, llm)
+	# await progress_bar_example(healing_service, llm)
+	# await cloud_backend_pattern(healing_service, llm)
 
 	print('\n✅ Examples completed!')
 
 
 if __name__ == '__main__':
-	asyncio.run(main())
+	run_async(main())
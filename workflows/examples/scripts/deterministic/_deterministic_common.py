@@ -0,0 +1,50 @@
+"""
+Shared helpers for the deterministic workflow example scripts.
+"""
+
+import asyncio
+import json
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+try:
+	import uvloop
+except ImportError:
+	uvloop = None
+
+
+def run_async(main: Coroutine[Any, Any, Any]) -> Any:
+	"""Run an example's entry coroutine, on uvloop when it is installed.
+
+	The loop keeps the default task factory: it also runs the browser agent and browser-use internals,
+	whose tasks should not start eagerly.
+	"""
+	loop_factory = uvloop.new_event_loop if uvloop is not None else None
+	with asyncio.Runner(loop_factory=loop_factory) as runner:
+		return runner.run(main)
+
+
+def write_workflow_json(output_file: str, workflow_dict: dict) -> None:
+	"""Encode the workflow straight into a temp file, then rename it over `output_file` so it is never half-written."""
+	tmp_file = f'{output_file}.tmp'
+	with open(tmp_file, 'w') as f:
+		json.dump(workflow_dict, f, indent=2)
+	os.replace(tmp_file, output_file)
+
+
+# Maps step['type'] to a function returning that step's key fields as display lines;
+# each script passes its own table so it keeps its own labels and fallbacks
+StepDetailPrinters = dict[str, Callable[[dict], list[str]]]
+
+
+def step_detail_lines(step: dict, printers: StepDetailPrinters) -> list[str]:
+	"""Return the key fields of a workflow step as display lines (empty for other types)."""
+	printer = printers.get(step.get('type'))
+	return printer(step) if printer else []
+
+
+def print_step_detail(step: dict, printers: StepDetailPrinters, indent: str = '      ') -> None:
+	"""Print the key fields of a workflow step, if its type has any."""
+	for line in step_detail_lines(step, printers):
+		print(f'{indent}{line}')
@@ -6,10 +6,9 @@ Usage:
     uv run python examples/auto_generate_workflow.py
 """
 
-import asyncio
 import os
 
-import aiofiles
+from _deterministic_common import run_async, write_workflow_json
 from browser_use.llm import ChatBrowserUse
 
 from workflow_use.healing.service import HealingService
@@ -108,12 +107,9 @@ async def auto_generate_workflow():
 		print(f'💾 Saving workflow to: {output_file}')
 
 		# Convert to dict and save
-		import json
-
 		workflow_dict = workflow.model_dump() if hasattr(workflow, 'model_dump') else workflow.dict()
 
-		async with aiofiles.open(output_file, 'w') as f:
-			await f.write(json.dumps(workflow_dict, indent=2))
+		write_workflow_json(output_file, workflow_dict)
 
 		print(f'   ✅ Saved to: {output_file}')
 		print()
@@ -148,5 +144,5 @@ async def auto_generate_workflow():
 
 if __name__ == '__main__':
 	print()
-	asyncio.run(auto_generate_workflow())
+	run_async(auto_generate_workflow())
 	print()
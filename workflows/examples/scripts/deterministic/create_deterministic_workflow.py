@@ -8,14 +8,23 @@ Usage:
     python create_deterministic_workflow.py
 """
 
-import asyncio
-import json
+import sys
+from collections import Counter
 
-import aiofiles
+from _deterministic_common import print_step_detail, run_async, write_workflow_json
 from browser_use.llm import ChatBrowserUse
 
 from workflow_use.healing.service import HealingService
 
+# Key fields shown under each step
+_STEP_DETAILS = {
+	'navigation': lambda step: [f'URL: {step.get("url", "N/A")}'],
+	'input': lambda step: [f'Target: {step.get("target_text", "N/A")}', f'Value: {step.get("value", "N/A")}'],
+	'click': lambda step: [f'Target: {step.get("target_text", "N/A")}'],
+	'keypress': lambda step: [f'Key: {step.get("key", "N/A")}', f'Target: {step.get("target_text", "N/A")}'],
+	'extract_page_content': lambda step: [f'Goal: {step.get("goal", "N/A")}'],
+}
+
 
 async def main():
 	# Task description - what you want the workflow to do
@@ -58,8 +67,7 @@ async def main():
 
 	# Save to file
 	output_file = 'github_stars_deterministic.workflow.json'
-	async with aiofiles.open(output_file, 'w') as f:
-		await f.write(json.dumps(workflow_dict, indent=2))
+	write_workflow_json(output_file, workflow_dict)
 
 	print(f'\n📁 Workflow saved to: {output_file}')
 
@@ -87,30 +95,17 @@ async def main():
 	steps = workflow_dict.get('steps', [])
 	print(f'\nWorkflow Steps ({len(steps)}):')
 
-	step_types = {}
-	for i, step in enumerate(steps, 1):
-		step_type = step.get('type', 'unknown')
+	# Read each step type once, interned so the Counter keys compare by identity
+	step_type_names = [sys.intern(step.get('type', 'unknown')) for step in steps]
+	step_types = Counter(step_type_names)
+	for i, (step, step_type) in enumerate(zip(steps, step_type_names), 1):
 		description = step.get('description', 'No description')
 
-		# Count step types
-		step_types[step_type] = step_types.get(step_type, 0) + 1
-
 		print(f'\n  Step {i}: {step_type}')
 		print(f'    Description: {description}')
 
 		# Show key fields based on step type
-		if step_type == 'navigation':
-			print(f'    URL: {step.get("url", "N/A")}')
-		elif step_type == 'input':
-			print(f'    Target: {step.get("target_text", "N/A")}')
-			print(f'    Value: {step.get("value", "N/A")}')
-		elif step_type == 'click':
-			print(f'    Target: {step.get("target_text", "N/A")}')
-		elif step_type == 'keypress':
-			print(f'    Key: {step.get("key", "N/A")}')
-			print(f'    Target: {step.get("target_text", "N/A")}')
-		elif step_type == 'extract_page_content':
-			print(f'    Goal: {step.get("goal", "N/A")}')
+		print_step_detail(step, _STEP_DETAILS, indent='    ')
 
 	# Show step type summary
 	print('\n' + '-' * 80)
@@ -143,4 +138,4 @@ async def main():
 
 
 if __name__ == '__main__':
-	asyncio.run(main())
+	run_async(main())
@@ -11,52 +11,68 @@ Usage:
     python run_complete_test.py
 """
 
-import asyncio
-import json
+import sys
+from collections import Counter
 
-import aiofiles
+from _deterministic_common import run_async, step_detail_lines, write_workflow_json
 from browser_use.llm import ChatBrowserUse
 
 from workflow_use.healing.service import HealingService
 
+# Key fields shown under each step in the summary
+_STEP_DETAILS = {
+	'navigation': lambda step: [f'URL: {step.get("url", "N/A")}'],
+	'input': lambda step: [f"Target: '{step.get('target_text', 'EMPTY')}'", f"Value: '{step.get('value', '')}'"],
+	'click': lambda step: [f"Target: '{step.get('target_text', 'EMPTY')}'"],
+	'keypress': lambda step: [f"Key: '{step.get('key', 'N/A')}'"],
+}
+
+# Step types that must carry a target_text
+_TARGETED_STEP_TYPES = frozenset({'input', 'click'})
+
 
 def validate_workflow(workflow_dict):
-	"""Validate the generated workflow meets quality standards."""
+	"""Validate the generated workflow meets quality standards.
+
+	Steps are walked once; alongside the issues and warnings this returns one
+	`(position, type, description, detail_lines)` row per step for the summary.
+	"""
 	issues = []
 	warnings = []
+	rows = []
 
 	# Check basic structure
 	if 'name' not in workflow_dict:
 		issues.append("Missing 'name' field")
 	if 'steps' not in workflow_dict:
 		issues.append("Missing 'steps' field")
-		return issues, warnings
+		return issues, warnings, rows
 
 	steps = workflow_dict['steps']
 
 	if len(steps) == 0:
 		issues.append('Workflow has no steps')
-		return issues, warnings
+		return issues, warnings, rows
 
 	# Analyze steps
 	agent_steps = []
-	semantic_steps = []
 	empty_target_text = []
 
 	for i, step in enumerate(steps, 1):
-		step_type = step.get('type', 'unknown')
+		# Interned so the type comparisons below can short-circuit on identity
+		step_type = sys.intern(step.get('type', 'unknown'))
 
 		if step_type == 'agent':
 			agent_steps.append(i)
-		else:
-			semantic_steps.append(i)
 
 		# Check target_text for input/click steps
-		if step_type in ['input', 'click']:
+		if step_type in _TARGETED_STEP_TYPES:
 			target_text = step.get('target_text', '')
 			if not target_text or target_text.strip() == '':
 				empty_target_text.append(i)
 
+		rows.append((i, step_type, step.get('description', 'No description')[:60], step_detail_lines(step, _STEP_DETAILS)))
+
 	# Report issues
 	if agent_steps:
 		issues.append(f'Found {len(agent_steps)} agent step(s) at positions: {agent_steps}')
@@ -64,7 +80,7 @@ def validate_workflow(workflow_dict):
 	if empty_target_text:
 		warnings.append(f'Found {len(empty_target_text)} step(s) with empty target_text at positions: {empty_target_text}')
 
-	return issues, warnings
+	return issues, warnings, rows
 
 
 async def main():
@@ -118,8 +134,7 @@ async def main():
 	output_file = 'complete_test_output.workflow.json'
 
 	try:
-		async with aiofiles.open(output_file, 'w') as f:
-			await f.write(json.dumps(workflow_dict, indent=2))
+		write_workflow_json(output_file, workflow_dict)
 		print(f'✅ Workflow saved to: {output_file}\n')
 	except Exception as e:
 		print(f'❌ FAILED: Could not save workflow: {e}\n')
@@ -127,7 +142,7 @@ async def main():
 
 	# Validate workflow
 	print('Step 4: Validating workflow structure...')
-	issues, warnings = validate_workflow(workflow_dict)
+	issues, warnings, rows = validate_workflow(workflow_dict)
 
 	if issues:
 		print('❌ VALIDATION FAILED:')
@@ -147,32 +162,15 @@ async def main():
 	print('Step 5: Workflow Summary')
 	print('-' * 80)
 
-	steps = workflow_dict.get('steps', [])
-	print(f'Total steps: {len(steps)}\n')
-
-	step_type_counts = {}
-	for i, step in enumerate(steps, 1):
-		step_type = step.get('type', 'unknown')
-		desc = step.get('description', 'No description')
-
-		step_type_counts[step_type] = step_type_counts.get(step_type, 0) + 1
+	print(f'Total steps: {len(rows)}\n')
 
-		print(f'  {i}. [{step_type}] {desc[:60]}')
+	step_type_counts = Counter(step_type for _, step_type, _, _ in rows)
+	for i, step_type, desc, detail_lines in rows:
+		print(f'  {i}. [{step_type}] {desc}')
 
 		# Show key fields
-		if step_type == 'navigation':
-			print(f'      URL: {step.get("url", "N/A")}')
-		elif step_type == 'input':
-			target = step.get('target_text', 'EMPTY')
-			value = step.get('value', '')
-			print(f"      Target: '{target}'")
-			print(f"      Value: '{value}'")
-		elif step_type == 'click':
-			target = step.get('target_text', 'EMPTY')
-			print(f"      Target: '{target}'")
-		elif step_type == 'keypress':
-			key = step.get('key', 'N/A')
-			print(f"      Key: '{key}'")
+		for line in detail_lines:
+			print(f'      {line}')
 
 	print('\nStep type breakdown:')
 	for step_type, count in sorted(step_type_counts.items()):
@@ -183,7 +181,7 @@ async def main():
 	print('FINAL RESULTS')
 	print('=' * 80)
 
-	agent_count = step_type_counts.get('agent', 0)
+	agent_count = step_type_counts['agent']
 	semantic_count = sum(count for stype, count in step_type_counts.items() if stype != 'agent')
 
 	print(f'\nSemantic steps: {semantic_count}')
@@ -233,4 +231,4 @@ async def main():
 
 
 if __name__ == '__main__':
-	asyncio.run(main())
+	run_async(main())
@@ -5,14 +5,17 @@ Usage:
     python test_custom_task.py
 """
 
-import asyncio
-import json
-
-import aiofiles
+from _deterministic_common import print_step_detail, run_async, write_workflow_json
 from browser_use.llm import ChatBrowserUse
 
 from workflow_use.healing.service import HealingService
 
+# Fields shown under each input/click step
+_STEP_DETAILS = {
+	'input': lambda step: [f"target_text: '{step.get('target_text', 'MISSING')}'", f"value: '{step.get('value', '')}'"],
+	'click': lambda step: [f"target_text: '{step.get('target_text', 'MISSING')}'"],
+}
+
 
 async def main():
 	# 🔧 CUSTOMIZE THIS - Change to your task
@@ -42,8 +45,7 @@ async def main():
 		# Save and analyze
 		workflow_dict = workflow.model_dump(exclude_none=True)
 
-		async with aiofiles.open('test_output.workflow.json', 'w') as f:
-			await f.write(json.dumps(workflow_dict, indent=2))
+		write_workflow_json('test_output.workflow.json', workflow_dict)
 
 		print('\n' + '=' * 80)
 		print('RESULTS')
@@ -63,14 +65,7 @@ async def main():
 			print(f'{i}. [{step_type}] {desc}')
 
 			# Show important fields
-			if step_type == 'input':
-				target = step.get('target_text', 'MISSING')
-				value = step.get('value', '')
-				print(f"   → target_text: '{target}'")
-				print(f"   → value: '{value}'")
-			elif step_type == 'click':
-				target = step.get('target_text', 'MISSING')
-				print(f"   → target_text: '{target}'")
+			print_step_detail(step, _STEP_DETAILS, indent='   → ')
 
 			# Count step types
 			if step_type == 'agent':
@@ -101,4 +96,4 @@ async def main():
 
 
 if __name__ == '__main__':
-	asyncio.run(main())
+	run_async(main())
@@ -9,17 +9,65 @@ Benefits:
 - More deterministic and predictable
 - Lower cost (fewer LLM calls)
 - Direct mapping from actions to semantic steps
+
+uvloop is used for the event loop when it is installed (optional).
 """
 
 import asyncio
-import json
+import os
+import traceback
+from collections import Counter
 
-import aiofiles
+from _deterministic_common import run_async, write_workflow_json
 from browser_use.llm import ChatBrowserUse
 
 from workflow_use.healing.service import HealingService
 
 
+async def _generate(service: HealingService, task: str, llm: ChatBrowserUse, output_file: str) -> dict:
+	"""Generate a workflow with `service`, save it to `output_file` and return its dict form."""
+	workflow = await service.generate_workflow_from_prompt(prompt=task, agent_llm=llm, extraction_llm=llm)
+
+	# Save the workflow
+	workflow_dict = workflow.model_dump(exclude_none=True)
+	await asyncio.get_running_loop().run_in_executor(None, write_workflow_json, output_file, workflow_dict)
+
+	return workflow_dict
+
+
+def _report(title: str, label: str, result: dict | BaseException, output_file: str) -> None:
+	"""Print the outcome of one generation run."""
+	print('\n' + '=' * 80)
+	print(title)
+	print('=' * 80)
+
+	if isinstance(result, BaseException):
+		print(f'\n❌ {label} generation failed: {result}')
+		traceback.print_exception(result)
+		return
+
+	print(f'\n✅ {label} workflow saved to: {output_file}')
+
+	# Analyze the workflow
+	steps = result.get('steps', [])
+	print(f'\nGenerated {len(steps)} steps:')
+
+	step_types = Counter(step.get('type', 'unknown') for step in steps)
+	for step in steps:
+		print(f'  - {step.get("type", "unknown")}: {step.get("description", "No description")}')
+
+	print('\nStep type breakdown:')
+	for step_type, count in step_types.items():
+		print(f'  {step_type}: {count}')
+
+	# Check for agent steps (should be ZERO with deterministic conversion)
+	agent_step_count = step_types['agent']
+	if agent_step_count == 0:
+		print(f'\n✅ No agent steps in {label} workflow')
+	else:
+		print(f'\n⚠️  Found {agent_step_count} agent steps in {label} workflow')
+
+
 async def test_deterministic_generation():
 	"""Test deterministic workflow generation vs LLM-based generation."""
 
@@ -31,110 +79,48 @@ async def test_deterministic_generation():
 	print('=' * 80)
 	print(f'\nTask: {task}\n')
 
-	# Initialize LLM (still needed for variable identification and browser agent)
+	# The LLM-based comparison doubles runtime and token spend, so it only runs on request
+	run_llm_comparison = os.environ.get('RUN_LLM_COMPARISON') == '1'
+
+	# Initialize LLM (still needed for variable identification and browser agent).
+	# One instance is shared by every service and role below.
 	llm = ChatBrowserUse(model='bu-latest')
 
 	# Test 1: Deterministic conversion (new approach)
-	print('\n' + '=' * 80)
-	print('TEST 1: DETERMINISTIC CONVERSION (Action → Semantic Step)')
-	print('=' * 80)
-
 	healing_service_deterministic = HealingService(
 		llm=llm,
 		enable_variable_extraction=True,
 		use_deterministic_conversion=True,  # 🔑 Enable deterministic mode
 	)
+	output_file = 'deterministic_workflow.workflow.json'
 
-	try:
-		workflow_deterministic = await healing_service_deterministic.generate_workflow_from_prompt(
-			prompt=task, agent_llm=llm, extraction_llm=llm
-		)
-
-		# Save the workflow
-		workflow_dict = workflow_deterministic.model_dump(exclude_none=True)
-
-		output_file = 'deterministic_workflow.workflow.json'
-		async with aiofiles.open(output_file, 'w') as f:
-			await f.write(json.dumps(workflow_dict, indent=2))
-
-		print(f'\n✅ Deterministic workflow saved to: {output_file}')
-
-		# Analyze the workflow
-		steps = workflow_dict.get('steps', [])
-		print(f'\nGenerated {len(steps)} steps:')
-
-		step_types = {}
-		for step in steps:
-			step_type = step.get('type', 'unknown')
-			step_types[step_type] = step_types.get(step_type, 0) + 1
-			print(f'  - {step_type}: {step.get("description", "No description")}')
-
-		print('\nStep type breakdown:')
-		for step_type, count in step_types.items():
-			print(f'  {step_type}: {count}')
-
-		# Check for agent steps (should be ZERO with deterministic conversion)
-		agent_step_count = step_types.get('agent', 0)
-		if agent_step_count == 0:
-			print('\n✅ SUCCESS: No agent steps! Pure semantic workflow.')
-		else:
-			print(f'\n⚠️  WARNING: Found {agent_step_count} agent steps')
-
-	except Exception as e:
-		print(f'\n❌ Deterministic generation failed: {e}')
-		import traceback
-
-		traceback.print_exc()
+	if not run_llm_comparison:
+		try:
+			result_deterministic = await _generate(healing_service_deterministic, task, llm, output_file)
+		except Exception as e:
+			result_deterministic = e
+		_report('TEST 1: DETERMINISTIC CONVERSION (Action → Semantic Step)', 'Deterministic', result_deterministic, output_file)
+		print('\nSkipping LLM comparison; set RUN_LLM_COMPARISON=1 to enable')
+		return
 
 	# Test 2: LLM-based conversion (original approach) for comparison
-	print('\n' + '=' * 80)
-	print('TEST 2: LLM-BASED CONVERSION (for comparison)')
-	print('=' * 80)
-
 	healing_service_llm = HealingService(
 		llm=llm,
 		enable_variable_extraction=True,
 		use_deterministic_conversion=False,  # Use LLM for step creation
 	)
+	output_file_llm = 'llm_based_workflow.workflow.json'
+
+	# Both runs are dominated by browser and LLM latency, so run them side by side
+	print('Running deterministic and LLM-based generation concurrently...')
+	result_deterministic, result_llm = await asyncio.gather(
+		_generate(healing_service_deterministic, task, llm, output_file),
+		_generate(healing_service_llm, task, llm, output_file_llm),
+		return_exceptions=True,
+	)
 
-	try:
-		workflow_llm = await healing_service_llm.generate_workflow_from_prompt(prompt=task, agent_llm=llm, extraction_llm=llm)
-
-		# Save the workflow
-		workflow_dict_llm = workflow_llm.model_dump(exclude_none=True)
-
-		output_file_llm = 'llm_based_workflow.workflow.json'
-		async with aiofiles.open(output_file_llm, 'w') as f:
-			await f.write(json.dumps(workflow_dict_llm, indent=2))
-
-		print(f'\n✅ LLM-based workflow saved to: {output_file_llm}')
-
-		# Analyze the workflow
-		steps_llm = workflow_dict_llm.get('steps', [])
-		print(f'\nGenerated {len(steps_llm)} steps:')
-
-		step_types_llm = {}
-		for step in steps_llm:
-			step_type = step.get('type', 'unknown')
-			step_types_llm[step_type] = step_types_llm.get(step_type, 0) + 1
-			print(f'  - {step_type}: {step.get("description", "No description")}')
-
-		print('\nStep type breakdown:')
-		for step_type, count in step_types_llm.items():
-			print(f'  {step_type}: {count}')
-
-		# Check for agent steps
-		agent_step_count_llm = step_types_llm.get('agent', 0)
-		if agent_step_count_llm == 0:
-			print('\n✅ No agent steps in LLM-based workflow')
-		else:
-			print(f'\n⚠️  Found {agent_step_count_llm} agent steps in LLM-based workflow')
-
-	except Exception as e:
-		print(f'\n❌ LLM-based generation failed: {e}')
-		import traceback
-
-		traceback.print_exc()
+	_report('TEST 1: DETERMINISTIC CONVERSION (Action → Semantic Step)', 'Deterministic', result_deterministic, output_file)
+	_report('TEST 2: LLM-BASED CONVERSION (for comparison)', 'LLM-based', result_llm, output_file_llm)
 
 	# Comparison
 	print('\n' + '=' * 80)
@@ -157,4 +143,4 @@ async def test_deterministic_generation():
 
 
 if __name__ == '__main__':
-	asyncio.run(test_deterministic_generation())
+	run_async(test_deterministic_generation())
@@ -10,14 +10,29 @@ Usage:
 
     Or with custom API key:
     BROWSER_USE_API_KEY=your_key uv run python examples/scripts/generate_workflow.py
+
+    Always regenerate instead of reusing a cached result for the same task:
+    GENWF_NO_CACHE=1 uv run python examples/scripts/generate_workflow.py
+
+    Also reuse the cached result of a near-identical task (off by default):
+    GENWF_FUZZY_CACHE=1 uv run python examples/scripts/generate_workflow.py
+
+uvloop is used for the event loop when it is installed (optional).
 """
 
-import asyncio
+import hashlib
+import json
+import os
+from collections import Counter
+from difflib import SequenceMatcher
 from pathlib import Path
+from typing import Optional
 
 from browser_use.llm import ChatBrowserUse
+from deterministic._deterministic_common import run_async
 
 from workflow_use.healing.service import HealingService
+from workflow_use.schema.views import WorkflowDefinitionSchema
 from workflow_use.storage.service import WorkflowStorageService
 
 # ============================================================================
@@ -40,15 +55,116 @@ ENABLE_VARIABLE_EXTRACTION = True
 # Use deterministic conversion (no LLM for step creation - faster, cheaper)
 USE_DETERMINISTIC_CONVERSION = True
 
+# LLM used for the browser agent, extraction and variable identification
+LLM_MODEL = 'bu-latest'
+
 # Storage directory for workflows
 STORAGE_DIR = Path(__file__).parent.parent.parent / 'storage'
 
+# Generated workflows are cached by task, model and conversion mode, so re-running
+# the same task skips the browser + LLM pipeline
+CACHE_DIR = STORAGE_DIR / '.genwf_cache'
+# Task text and settings per cache key, so fuzzy lookups don't parse every cached workflow
+CACHE_INDEX = CACHE_DIR / 'index.json'
+FUZZY_CACHE_MIN_RATIO = 0.95
+
 
 # ============================================================================
 # MAIN SCRIPT - DO NOT MODIFY BELOW UNLESS YOU KNOW WHAT YOU'RE DOING
 # ============================================================================
 
 
+def _print_navigation(step) -> None:
+	print(f'    URL: {step.url}')
+
+
+def _print_input(step) -> None:
+	print(f'    Target: {step.target_text}')
+	print(f'    Value: {step.value}')
+
+
+def _print_click(step) -> None:
+	print(f'    Target: {step.target_text}')
+
+
+def _print_key_press(step) -> None:
+	print(f'    Key: {step.key}')
+
+
+def _print_extract(step) -> None:
+	print(f'    Goal: {step.extractionGoal}')
+	if step.output:
+		print(f'    Output Variable: {step.output}')
+
+
+# Key fields shown in the summary for each step type
+_STEP_PRINTERS = {
+	'navigation': _print_navigation,
+	'input': _print_input,
+	'click': _print_click,
+	'key_press': _print_key_press,
+	'extract': _print_extract,
+}
+
+
+def _cache_key(task: str) -> str:
+	return hashlib.sha256(f'{task}|{LLM_MODEL}|{USE_DETERMINISTIC_CONVERSION}'.encode()).hexdigest()
+
+
+def _load_cache_index() -> dict:
+	try:
+		return json.loads(CACHE_INDEX.read_bytes())
+	except (OSError, ValueError):
+		return {}
+
+
+def _read_cached_workflow(key: str) -> Optional[WorkflowDefinitionSchema]:
+	try:
+		entry = json.loads((CACHE_DIR / f'{key}.json').read_bytes())
+	except (OSError, ValueError):
+		return None
+	return WorkflowDefinitionSchema(**entry['workflow'])
+
+
+def load_cached_workflow(task: str) -> Optional[WorkflowDefinitionSchema]:
+	"""Return a previously generated workflow for `task`, or None on a cache miss.
+
+	Only an exact match on the cache key is reused by default. With GENWF_FUZZY_CACHE=1, a cached task
+	generated with the same settings and at least FUZZY_CACHE_MIN_RATIO similar text is reused too; prompts
+	differing only by a date or an ID easily clear that bar, so the reused task is printed.
+	"""
+	if os.environ.get('GENWF_NO_CACHE') == '1' or not CACHE_DIR.exists():
+		return None
+
+	workflow = _read_cached_workflow(_cache_key(task))
+	if workflow is not None or os.environ.get('GENWF_FUZZY_CACHE') != '1':
+		return workflow
+
+	for key, entry in _load_cache_index().items():
+		if entry.get('model') != LLM_MODEL or entry.get('deterministic') != USE_DETERMINISTIC_CONVERSION:
+			continue
+		cached_task = entry.get('task', '')
+		if SequenceMatcher(None, cached_task, task).ratio() >= FUZZY_CACHE_MIN_RATIO:
+			workflow = _read_cached_workflow(key)
+			if workflow is not None:
+				print(f'Reusing the cached workflow of a similar task: {cached_task.strip()!r}')
+				return workflow
+
+	return None
+
+
+def save_cached_workflow(task: str, workflow: WorkflowDefinitionSchema) -> None:
+	"""Cache a generated workflow for later runs of the same task."""
+	CACHE_DIR.mkdir(parents=True, exist_ok=True)
+	key = _cache_key(task)
+	settings = {'task': task, 'model': LLM_MODEL, 'deterministic': USE_DETERMINISTIC_CONVERSION}
+	(CACHE_DIR / f'{key}.json').write_text(json.dumps({**settings, 'workflow': workflow.model_dump(exclude_none=True)}))
+
+	index = _load_cache_index()
+	index[key] = settings
+	CACHE_INDEX.write_text(json.dumps(index))
+
+
 async def generate_and_store_workflow():
 	"""Generate a workflow from the task description and store it."""
 
@@ -58,25 +174,33 @@ async def generate_and_store_workflow():
 	print(f'\nTask Name: {TASK_NAME}')
 	print(f'Task Description: {TASK_DESCRIPTION.strip()}\n')
 
-	# Initialize LLM
-	print('Step 1: Initializing LLM...')
-	llm = ChatBrowserUse(model='bu-latest')
+	workflow = load_cached_workflow(TASK_DESCRIPTION)
 
-	# Create HealingService for workflow generation
-	print('Step 2: Setting up workflow generation service...')
-	healing_service = HealingService(
-		llm=llm, enable_variable_extraction=ENABLE_VARIABLE_EXTRACTION, use_deterministic_conversion=USE_DETERMINISTIC_CONVERSION
-	)
+	if workflow is not None:
+		print('Steps 1-3: Reusing cached workflow for this task (set GENWF_NO_CACHE=1 to regenerate)\n')
+	else:
+		# Initialize LLM (one instance serves the agent, extraction and variable identification)
+		print('Step 1: Initializing LLM...')
+		llm = ChatBrowserUse(model=LLM_MODEL)
 
-	# Generate workflow
-	print('\nStep 3: Recording browser interactions and generating workflow...')
-	print('(This will open a browser and execute the task)\n')
+		# Create HealingService for workflow generation
+		print('Step 2: Setting up workflow generation service...')
+		healing_service = HealingService(
+			llm=llm,
+			enable_variable_extraction=ENABLE_VARIABLE_EXTRACTION,
+			use_deterministic_conversion=USE_DETERMINISTIC_CONVERSION,
+		)
 
-	workflow = await healing_service.generate_workflow_from_prompt(
-		prompt=TASK_DESCRIPTION, agent_llm=llm, extraction_llm=llm, use_cloud=True
-	)
+		# Generate workflow
+		print('\nStep 3: Recording browser interactions and generating workflow...')
+		print('(This will open a browser and execute the task)\n')
+
+		workflow = await healing_service.generate_workflow_from_prompt(
+			prompt=TASK_DESCRIPTION, agent_llm=llm, extraction_llm=llm, use_cloud=True
+		)
+		save_cached_workflow(TASK_DESCRIPTION, workflow)
 
-	print('✅ Workflow generated successfully!\n')
+		print('✅ Workflow generated successfully!\n')
 
 	# Initialize storage service
 	print('Step 4: Storing workflow...')
@@ -118,30 +242,18 @@ async def generate_and_store_workflow():
 	if workflow.steps:
 		print(f'\nWorkflow Steps ({len(workflow.steps)}):')
 
-		step_types = {}
+		step_types = Counter(step.type for step in workflow.steps)
 		for i, step in enumerate(workflow.steps, 1):
 			step_type = step.type
-			step_types[step_type] = step_types.get(step_type, 0) + 1
 
 			print(f'\n  Step {i}: {step_type}')
-			if hasattr(step, 'description') and step.description:
+			if step.description:
 				print(f'    Description: {step.description}')
 
 			# Show key fields based on step type
-			if step_type == 'navigation' and hasattr(step, 'url'):
-				print(f'    URL: {step.url}')
-			elif step_type == 'input' and hasattr(step, 'target_text'):
-				print(f'    Target: {step.target_text}')
-				if hasattr(step, 'value'):
-					print(f'    Value: {step.value}')
-			elif step_type == 'click' and hasattr(step, 'target_text'):
-				print(f'    Target: {step.target_text}')
-			elif step_type == 'key_press' and hasattr(step, 'key'):
-				print(f'    Key: {step.key}')
-			elif step_type == 'extract' and hasattr(step, 'extractionGoal'):
-				print(f'    Goal: {step.extractionGoal}')
-				if hasattr(step, 'output'):
-					print(f'    Output Variable: {step.output}')
+			printer = _STEP_PRINTERS.get(step_type)
+			if printer:
+				printer(step)
 
 		# Show step type summary
 		print('\n' + '-' * 80)
@@ -150,7 +262,7 @@ async def generate_and_store_workflow():
 			print(f'  {step_type}: {count}')
 
 		# Check for agent steps
-		agent_steps = step_types.get('agent', 0)
+		agent_steps = step_types['agent']
 		if agent_steps == 0:
 			print('\n✅ Pure semantic workflow (no agent steps)')
 			print('   This workflow will execute fast and cost $0 per run!')
@@ -184,4 +296,4 @@ async def generate_and_store_workflow():
 
 
 if __name__ == '__main__':
-	asyncio.run(generate_and_store_workflow())
+	run_async(generate_and_store_workflow())
@@ -10,24 +10,41 @@ Prerequisites:
 Run: uv run python examples/run_workflow_with_variables.py
 """
 
+import asyncio
 import json
-from pathlib import Path
-from typing import Optional
+import re
+import time
+from typing import Any, Callable, Optional
+
+import aiofiles
+import aiofiles.os
 
 from workflow_use.schema.views import WorkflowDefinitionSchema
 
+try:
+	from orjson import loads as json_loads
+except ImportError:
+	from json import loads as json_loads
+
+# Workflow files used by the examples; they are all loaded up front, concurrently
+GITHUB_STARS_WORKFLOW = 'examples/github_stars_parameterized.workflow.json'
+PRODUCT_SEARCH_WORKFLOW = '/tmp/product_search_processed.workflow.json'
+FORM_FILL_WORKFLOW = 'examples/semantic_form_fill.workflow.json'
+USER_PROFILE_WORKFLOW = '/tmp/user_profile.workflow.json'
+
+# A `{variable}` placeholder inside a step field
+_VAR_RE = re.compile(r'\{[A-Za-z_][A-Za-z0-9_]*\}')
 
-def load_workflow(file_path: str) -> Optional[WorkflowDefinitionSchema]:
-	"""Load and validate a workflow."""
-	path = Path(file_path)
 
-	if not path.exists():
+async def load_workflow(file_path: str) -> Optional[WorkflowDefinitionSchema]:
+	"""Load and validate a workflow."""
+	if not await aiofiles.os.path.exists(file_path):
 		print(f'⚠️  Workflow not found: {file_path}')
 		return None
 
 	try:
-		with open(path) as f:
-			data = json.load(f)
+		async with aiofiles.open(file_path, 'rb') as f:
+			data = json_loads(await f.read())
 
 		workflow = WorkflowDefinitionSchema(**data)
 		return workflow
@@ -36,6 +53,37 @@ def load_workflow(file_path: str) -> Optional[WorkflowDefinitionSchema]:
 		return None
 
 
+async def batch_run(make_workflow: Callable[[], Any], inputs_list: list[dict], max_concurrency: int = 5) -> list:
+	"""Run a workflow once per distinct input set, with at most `max_concurrency` runs in flight.
+
+	A Workflow drives a single browser session, so every run gets its own instance
+	from `make_workflow`. Duplicate input sets share one run. Results are returned
+	in input order; a failed run yields its exception instead of a result.
+	"""
+	semaphore = asyncio.Semaphore(max_concurrency)
+
+	async def _run(inputs: dict):
+		async with semaphore:
+			return await make_workflow().run(inputs=inputs)
+
+	keys = [json.dumps(inputs, sort_keys=True, default=str) for inputs in inputs_list]
+	unique_inputs: dict[str, dict] = {}
+	for key, inputs in zip(keys, inputs_list):
+		unique_inputs.setdefault(key, inputs)
+
+	results = await asyncio.gather(*[_run(inputs) for inputs in unique_inputs.values()], return_exceptions=True)
+	results_by_key = dict(zip(unique_inputs, results))
+	return [results_by_key[key] for key in keys]
+
+
+class _SimulatedWorkflow:
+	"""Stand-in for Workflow that takes a fixed time per run instead of driving a browser."""
+
+	async def run(self, inputs: dict) -> dict:
+		await asyncio.sleep(0.2)
+		return {'inputs': inputs, 'stars': len(inputs['repo_name']) * 1000}
+
+
 def show_workflow_info(workflow: WorkflowDefinitionSchema):
 	"""Display workflow information."""
 	print(f'\n📋 Workflow: {workflow.name}')
@@ -53,21 +101,20 @@ def show_workflow_info(workflow: WorkflowDefinitionSchema):
 		print(f'   {i}. {step.type}: {desc}')
 
 		# Show variables in use
-		if hasattr(step, 'value') and '{' in str(step.value):
-			print(f'      └─ value: {step.value}')
-		if hasattr(step, 'target_text') and '{' in str(step.target_text):
-			print(f'      └─ target_text: {step.target_text} ⭐')
+		value = getattr(step, 'value', None)
+		if isinstance(value, str) and _VAR_RE.search(value):
+			print(f'      └─ value: {value}')
+		target_text = getattr(step, 'target_text', None)
+		if isinstance(target_text, str) and _VAR_RE.search(target_text):
+			print(f'      └─ target_text: {target_text} ⭐')
 
 
-def example_1_github_stars():
+def example_1_github_stars(workflow: Optional[WorkflowDefinitionSchema]):
 	"""Example 1: Get stars for different repositories."""
 	print('\n' + '=' * 70)
 	print('EXAMPLE 1: GitHub Repository Stars')
 	print('=' * 70)
 
-	workflow_path = 'examples/github_stars_parameterized.workflow.json'
-	workflow = load_workflow(workflow_path)
-
 	if not workflow:
 		print('Creating example workflow instead...')
 		workflow = WorkflowDefinitionSchema(
@@ -125,16 +172,12 @@ def example_1_github_stars():
     """)
 
 
-def example_2_product_search():
-	"""Example 2: Search for different products."""
+def example_2_product_search(workflow: Optional[WorkflowDefinitionSchema]):
+	"""Example 2: Search for different products (workflow from the create script, if present)."""
 	print('\n\n' + '=' * 70)
 	print('EXAMPLE 2: Product Price Comparison')
 	print('=' * 70)
 
-	# Check if created by create script
-	workflow_path = '/tmp/product_search_processed.workflow.json'
-	workflow = load_workflow(workflow_path)
-
 	if not workflow:
 		print('Creating example workflow...')
 		workflow = WorkflowDefinitionSchema(
@@ -168,14 +211,12 @@ def example_2_product_search():
 	print('✅ One workflow, compare unlimited products!')
 
 
-def example_3_form_filling():
+def example_3_form_filling(workflow: Optional[WorkflowDefinitionSchema]):
 	"""Example 3: Fill forms with different user data."""
 	print('\n\n' + '=' * 70)
 	print('EXAMPLE 3: Form Filling with Different Users')
 	print('=' * 70)
 
-	workflow = load_workflow('examples/semantic_form_fill.workflow.json')
-
 	if not workflow:
 		print('Creating example workflow...')
 		workflow = WorkflowDefinitionSchema(
@@ -218,15 +259,12 @@ def example_3_form_filling():
 	print('   Perfect for QA testing, data entry, automation')
 
 
-def example_4_user_profiles():
+def example_4_user_profiles(workflow: Optional[WorkflowDefinitionSchema]):
 	"""Example 4: Navigate to different user profiles."""
 	print('\n\n' + '=' * 70)
 	print('EXAMPLE 4: User Profile Navigation')
 	print('=' * 70)
 
-	workflow_path = '/tmp/user_profile.workflow.json'
-	workflow = load_workflow(workflow_path)
-
 	if not workflow:
 		print('Creating example workflow...')
 		workflow = WorkflowDefinitionSchema(
@@ -257,7 +295,7 @@ def example_4_user_profiles():
 	print("   Note: target_text combines '@' with {username} variable")
 
 
-def example_5_batch_execution():
+async def example_5_batch_execution():
 	"""Example 5: Batch execution with multiple inputs."""
 	print('\n\n' + '=' * 70)
 	print('EXAMPLE 5: Batch Execution')
@@ -266,16 +304,18 @@ def example_5_batch_execution():
 	print('\n💻 Running workflows in batch mode:\n')
 
 	print("""
-    async def batch_run(workflow, inputs_list):
-        '''Run workflow with multiple input sets.'''
-        results = []
+    import asyncio
+
+    async def batch_run(make_workflow, inputs_list, max_concurrency=5):
+        '''Run workflow with multiple input sets, a few at a time.'''
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-        for inputs in inputs_list:
-            print(f"Running with: {inputs}")
-            result = await workflow.run(inputs=inputs)
-            results.append(result)
+        async def _run(inputs):
+            async with semaphore:
+                # Each run needs its own Workflow (and browser session)
+                return await make_workflow().run(inputs=inputs)
 
-        return results
+        return await asyncio.gather(*[_run(i) for i in inputs_list], return_exceptions=True)
 
     # Example: Check stars for multiple repos
     repos = [
@@ -284,15 +324,41 @@ def example_5_batch_execution():
         {'repo_name': 'langchain-ai/langchain'},
     ]
 
-    results = await batch_run(workflow, repos)
+    results = await batch_run(
+        lambda: Workflow.load_from_file('github_stars.workflow.json', llm=llm),
+        repos,
+    )
 
     # Process results
-    for i, result in enumerate(results):
-        print(f"{repos[i]['repo_name']}: {result.context['stars']} stars")
+    for repo, result in zip(repos, results):
+        print(f"{repo['repo_name']}: {result.context['stars']} stars")
     """)
 
+	print('\n⏱️  Simulated batch (0.2s per run, 6 inputs with one duplicate -> 5 runs):')
+	repos = [
+		{'repo_name': 'browser-use/browser-use'},
+		{'repo_name': 'anthropics/anthropic-sdk-python'},
+		{'repo_name': 'langchain-ai/langchain'},
+		{'repo_name': 'openai/openai-python'},
+		{'repo_name': 'microsoft/vscode'},
+		{'repo_name': 'browser-use/browser-use'},
+	]
+	for max_concurrency in (1, 5):
+		# Duplicate inputs share a run, so count the workflows actually created
+		runs = 0
+
+		def make_workflow() -> _SimulatedWorkflow:
+			nonlocal runs
+			runs += 1
+			return _SimulatedWorkflow()
+
+		start = time.perf_counter()
+		results = await batch_run(make_workflow, repos, max_concurrency=max_concurrency)
+		elapsed = time.perf_counter() - start
+		print(f'   max_concurrency={max_concurrency}: {runs} runs for {len(results)} inputs in {elapsed:.2f}s')
+
 	print('\n✅ Benefits of batch execution:')
-	print('   • Process multiple items automatically')
+	print('   • Process multiple items automatically, several at once')
 	print('   • Compare results across inputs')
 	print('   • Generate reports')
 	print('   • Automated testing')
@@ -342,18 +408,22 @@ def example_6_validation():
 	print("      → Warning: 'extra' not in schema (but allowed)")
 
 
-def main():
+async def main():
 	"""Run all examples."""
 	print('\n')
 	print('╔' + '=' * 68 + '╗')
 	print('║' + ' ' * 15 + 'Running Workflows with Variables' + ' ' * 20 + '║')
 	print('╚' + '=' * 68 + '╝')
 
-	example_1_github_stars()
-	example_2_product_search()
-	example_3_form_filling()
-	example_4_user_profiles()
-	example_5_batch_execution()
+	# Read every example workflow concurrently instead of one file per example
+	paths = [GITHUB_STARS_WORKFLOW, PRODUCT_SEARCH_WORKFLOW, FORM_FILL_WORKFLOW, USER_PROFILE_WORKFLOW]
+	workflows = dict(zip(paths, await asyncio.gather(*[load_workflow(path) for path in paths])))
+
+	example_1_github_stars(workflows[GITHUB_STARS_WORKFLOW])
+	example_2_product_search(workflows[PRODUCT_SEARCH_WORKFLOW])
+	example_3_form_filling(workflows[FORM_FILL_WORKFLOW])
+	example_4_user_profiles(workflows[USER_PROFILE_WORKFLOW])
+	await example_5_batch_execution()
 	example_6_validation()
 
 	print('\n\n' + '=' * 70)
@@ -406,4 +476,4 @@ def main():
 
 
 if __name__ == '__main__':
-	main()
+	asyncio.run(main())
@@ -7,55 +7,119 @@ Usage:
 """
 
 import argparse
+import fnmatch
+import functools
 import json
+import os
+import re
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Callable
 
 import yaml
 
+# libyaml's C emitter when PyYAML was built with it; workflow JSON only holds plain types
+try:
+	from yaml import CSafeDumper as _Dumper
+except ImportError:
+	from yaml import SafeDumper as _Dumper
 
-def migrate_workflow(json_path: Path, backup: bool = True) -> bool:
-	"""
-	Convert a single JSON workflow file to YAML.
 
-	Args:
-	    json_path: Path to the JSON workflow file
-	    backup: Whether to create a .bak backup of the original
+class _WorkflowDumper(_Dumper):
+	"""Dumper shared by every migrated file; workflow-specific representers are registered on it, once."""
 
-	Returns:
-	    True if successful, False otherwise
+	def represent_block_dict(self, data):
+		# Passing items() keeps insertion order without consulting sort_keys
+		return self.represent_mapping('tag:yaml.org,2002:map', data.items(), flow_style=False)
+
+	def represent_block_list(self, data):
+		return self.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=False)
+
+
+# Workflows are always emitted in block style and key order, so fix that in the representers
+# rather than threading default_flow_style / sort_keys through every dump call
+_WorkflowDumper.add_representer(dict, _WorkflowDumper.represent_block_dict)
+_WorkflowDumper.add_representer(list, _WorkflowDumper.represent_block_list)
+
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+if orjson is not None:
+	_loads = orjson.loads
+
+	def _dumps(obj) -> bytes:
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+	_loads = json.loads
+
+	def _dumps(obj) -> bytes:
+		return json.dumps(obj, indent=2).encode()
+
+
+def _migrate_workflow(json_path: Path, backup: bool = True) -> tuple[bool, list[str]]:
+	"""Convert one JSON workflow file to YAML, returning success and the log lines to print.
+
+	Collecting the lines instead of printing keeps output ordered when files are migrated in worker processes.
 	"""
+	log = []
 	try:
 		# Read JSON
-		with open(json_path, 'r') as f:
-			data = json.load(f)
+		with open(json_path, 'rb') as f:
+			data = _loads(f.read())
 
 		# Create YAML path
 		yaml_path = json_path.with_suffix('.yaml')
+		tmp_path = yaml_path.with_name(yaml_path.name + '.tmp')
 
-		# Backup original if requested
-		if backup:
-			backup_path = json_path.with_suffix(json_path.suffix + '.bak')
-			shutil.copy2(json_path, backup_path)
-			print(f'  ✓ Backed up to: {backup_path.name}')
+		# Serialize to UTF-8 bytes in memory, then write the file in one call instead of many small emitter writes
+		buf = yaml.dump(data, Dumper=_WorkflowDumper, allow_unicode=True, encoding='utf-8')
+		tmp_path.write_bytes(buf)
 
-		# Write YAML
-		with open(yaml_path, 'w') as f:
-			yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+		try:
+			# Swap the finished YAML in, so a crash never leaves a partial file at yaml_path
+			os.replace(tmp_path, yaml_path)
+		except BaseException:
+			tmp_path.unlink(missing_ok=True)
+			raise
 
-		print(f'  ✓ Created YAML: {yaml_path.name}')
+		log.append(f'  ✓ Created YAML: {yaml_path.name}')
 
-		# Remove original JSON (only if backup was created)
+		# Backup original if requested: renaming it to .bak keeps its bytes and removes the JSON in one step.
+		# Done only once the YAML is in place, so a failure never leaves the workflow at neither path
 		if backup:
-			json_path.unlink()
-			print(f'  ✓ Removed JSON: {json_path.name}')
+			backup_path = json_path.with_suffix(json_path.suffix + '.bak')
+			os.replace(json_path, backup_path)
+			log.append(f'  ✓ Backed up to: {backup_path.name}')
+			log.append(f'  ✓ Removed JSON: {json_path.name}')
 
-		return True
+		return True, log
 
 	except Exception as e:
-		print(f'  ✗ Error migrating {json_path.name}: {e}')
-		return False
+		log.append(f'  ✗ Error migrating {json_path.name}: {e}')
+		return False, log
+
+
+def migrate_workflow(json_path: Path, backup: bool = True) -> bool:
+	"""
+	Convert a single JSON workflow file to YAML.
+
+	Args:
+	    json_path: Path to the JSON workflow file
+	    backup: Whether to create a .bak backup of the original
+
+	Returns:
+	    True if successful, False otherwise
+	"""
+	ok, log = _migrate_workflow(json_path, backup=backup)
+	for line in log:
+		print(line)
+	return ok
 
 
 def update_metadata(metadata_path: Path, dry_run: bool = False) -> bool:
@@ -74,9 +138,10 @@ def update_metadata(metadata_path: Path, dry_run: bool = False) -> bool:
 			print(f'No metadata file found at {metadata_path}')
 			return True
 
-		with open(metadata_path, 'r') as f:
-			metadata = json.load(f)
+		with open(metadata_path, 'rb') as f:
+			metadata = _loads(f.read())
 
+		# Only each workflow entry's own file_path is rewritten; nested values are left alone
 		updated_count = 0
 		for workflow_id, workflow_meta in metadata.items():
 			if 'file_path' in workflow_meta:
@@ -95,9 +160,10 @@ def update_metadata(metadata_path: Path, dry_run: bool = False) -> bool:
 			backup_path = metadata_path.with_suffix('.json.bak')
 			shutil.copy2(metadata_path, backup_path)
 
-			# Write updated metadata
-			with open(metadata_path, 'w') as f:
-				json.dump(metadata, f, indent=2)
+			# Write updated metadata to a temp file and swap it in, so a crash never leaves it half-written
+			tmp_path = metadata_path.with_suffix('.json.tmp')
+			tmp_path.write_bytes(_dumps(metadata))
+			os.replace(tmp_path, metadata_path)
 
 			print(f'✓ Updated {updated_count} file paths in metadata.json')
 			print('✓ Backed up original to metadata.json.bak')
@@ -111,6 +177,29 @@ def update_metadata(metadata_path: Path, dry_run: bool = False) -> bool:
 		return False
 
 
+def _name_matcher(pattern: str) -> Callable[[str], bool]:
+	"""Build a case-sensitive file-name test for a glob pattern, compiled once.
+
+	Patterns of the form '*<literal>' (like the default '*.workflow.json') become a plain str.endswith check.
+	"""
+	suffix = pattern[1:]
+	if pattern.startswith('*') and not any(c in suffix for c in '*?['):
+		return lambda name: name.endswith(suffix)
+	return re.compile(fnmatch.translate(pattern)).match
+
+
+def _walk_files(root: Path):
+	"""Yield an os.DirEntry for every regular file under `root`, without following symlinked directories."""
+	stack = [root]
+	while stack:
+		with os.scandir(stack.pop()) as it:
+			for entry in it:
+				if entry.is_dir(follow_symlinks=False):
+					stack.append(entry.path)
+				elif entry.is_file():
+					yield entry
+
+
 def migrate_directory(directory: Path, pattern: str = '*.workflow.json', dry_run: bool = False, backup: bool = True):
 	"""
 	Migrate all workflow JSON files in a directory to YAML.
@@ -121,7 +210,15 @@ def migrate_directory(directory: Path, pattern: str = '*.workflow.json', dry_run
 	    dry_run: If True, only print what would be done
 	    backup: Whether to create backups
 	"""
-	workflow_files = list(directory.rglob(pattern))
+	# One walk finds both the workflow files and the metadata files to update afterwards
+	matches_pattern = _name_matcher(pattern)
+	workflow_files = []
+	metadata_files = []
+	for entry in _walk_files(directory):
+		if matches_pattern(entry.name):
+			workflow_files.append(Path(entry.path))
+		if entry.name == 'metadata.json':
+			metadata_files.append(Path(entry.path))
 
 	if not workflow_files:
 		print(f"No workflow files matching '{pattern}' found in {directory}")
@@ -132,22 +229,31 @@ def migrate_directory(directory: Path, pattern: str = '*.workflow.json', dry_run
 	success_count = 0
 	fail_count = 0
 
-	for json_path in workflow_files:
-		print(f'Migrating: {json_path.relative_to(directory)}')
-
-		if dry_run:
+	if dry_run:
+		for json_path in workflow_files:
+			print(f'Migrating: {json_path.relative_to(directory)}')
 			print(f'  [DRY RUN] Would convert to: {json_path.with_suffix(".yaml").name}')
-			success_count += 1
-		else:
-			if migrate_workflow(json_path, backup=backup):
-				success_count += 1
-			else:
-				fail_count += 1
-		print()
+			print()
+		success_count = len(workflow_files)
+	else:
+		# Files are independent, so convert them in worker processes; map() yields results
+		# in input order, which keeps the per-file output readable
+		migrate = functools.partial(_migrate_workflow, backup=backup)
+		with ProcessPoolExecutor() if len(workflow_files) > 1 else nullcontext() as executor:
+			results = executor.map(migrate, workflow_files) if executor else map(migrate, workflow_files)
+			for json_path, (ok, log) in zip(workflow_files, results):
+				print(f'Migrating: {json_path.relative_to(directory)}')
+				for line in log:
+					print(line)
+				print()
+				if ok:
+					success_count += 1
+				else:
+					fail_count += 1
 
 	# Update metadata files
 	print('\nUpdating metadata files...')
-	for metadata_path in directory.rglob('metadata.json'):
+	for metadata_path in metadata_files:
 		print(f'\nProcessing metadata: {metadata_path.relative_to(directory)}')
 		update_metadata(metadata_path, dry_run=dry_run)
 
@@ -4,38 +4,54 @@ Run all unit tests for the semantic-only workflow system.
 This script runs all test modules and provides a summary.
 """
 
-import subprocess
 import sys
+from collections import Counter
+from pathlib import Path
 
+import pytest
 
-def run_test_file(test_file):
-	"""Run a single test file and return (passed, failed)"""
-	print(f'\n{"=" * 80}')
-	print(f'Running {test_file}')
-	print(f'{"=" * 80}')
-
-	result = subprocess.run(['uv', 'run', 'python', f'workflows/tests/{test_file}'], capture_output=True, text=True)
-
-	# Print output
-	print(result.stdout)
-	if result.stderr:
-		print(result.stderr)
-
-	# Parse results from output
-	for line in result.stdout.split('\n'):
-		if 'Test Results:' in line:
-			# Extract passed and failed counts
-			# Format: "Test Results: X passed, Y failed"
-			parts = line.split(':')[1].strip().split(',')
-			passed = int(parts[0].split()[0])
-			failed = int(parts[1].split()[0])
-			return (passed, failed)
-
-	# If we couldn't parse, check exit code
-	if result.returncode == 0:
-		return (1, 0)  # Assume some tests passed
-	else:
-		return (0, 1)  # Assume some tests failed
+try:
+	import xdist
+except ImportError:
+	xdist = None
+
+TESTS_DIR = Path(__file__).parent
+
+
+def _test_file(report) -> str:
+	return Path(report.nodeid.split('::', 1)[0]).name
+
+
+class _ResultCollector:
+	"""pytest plugin that tallies passed and failed tests per test file."""
+
+	def __init__(self):
+		self.passed = Counter()
+		self.failed = Counter()
+		self.exit_code = pytest.ExitCode.OK
+
+	def pytest_collectreport(self, report):
+		# A file that fails to import or collect has no test reports, so count it as a failure here
+		if report.failed:
+			self.failed[_test_file(report)] += 1
+
+	def pytest_runtest_logreport(self, report):
+		test_file = _test_file(report)
+		if report.failed:
+			self.failed[test_file] += 1
+		elif report.passed and report.when == 'call':
+			self.passed[test_file] += 1
+
+
+def run_test_files(test_files):
+	"""Run the test files in one pytest session; returns a _ResultCollector with the per-file counts and exit code"""
+	collector = _ResultCollector()
+	args = [str(TESTS_DIR / test_file) for test_file in test_files] + ['-q']
+	if xdist is not None:
+		# The test files are independent, so spread them over all cores
+		args += ['-n', 'auto']
+	collector.exit_code = pytest.main(args, plugins=[collector])
+	return collector
 
 
 def main():
@@ -50,16 +66,12 @@ def main():
 	print('SEMANTIC-ONLY WORKFLOW SYSTEM - UNIT TEST SUITE')
 	print('=' * 80)
 
-	total_passed = 0
-	total_failed = 0
-
-	results = []
+	# A single in-process session pays the interpreter and import cost once for all files
+	collector = run_test_files(test_files)
 
-	for test_file in test_files:
-		passed, failed = run_test_file(test_file)
-		total_passed += passed
-		total_failed += failed
-		results.append((test_file, passed, failed))
+	results = [(test_file, collector.passed[test_file], collector.failed[test_file]) for test_file in test_files]
+	total_passed = sum(collector.passed.values())
+	total_failed = sum(collector.failed.values())
 
 	# Print summary
 	print('\n' + '=' * 80)
@@ -74,8 +86,9 @@ def main():
 	print(f'TOTAL: {total_passed} passed, {total_failed} failed')
 	print(f'{"=" * 80}\n')
 
-	if total_failed > 0:
-		print('❌ Some tests failed!')
+	# Also fail on a nonzero exit with nothing counted, e.g. an internal or usage error
+	if total_failed > 0 or collector.exit_code != pytest.ExitCode.OK:
+		print(f'❌ Some tests failed! (pytest exit code {int(collector.exit_code)})')
 		sys.exit(1)
 	else:
 		print('✅ All tests passed!')
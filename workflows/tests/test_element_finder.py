@@ -5,11 +5,29 @@ Tests that ElementFinder correctly searches browser-use's DOM state using semant
 and returns element indices (not Playwright element handles).
 """
 
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, Mock
 
+import pytest
+
 from workflow_use.workflow.element_finder import ElementFinder
 
 
+@dataclass(slots=True)
+class FakeNode:
+	"""Lightweight stand-in for a browser-use DOM node (much cheaper to build than a Mock)"""
+
+	text: str = ''
+	tag_name: str = ''
+	role: str = ''
+	aria_label: str = ''
+	placeholder: str = ''
+	title: str = ''
+	alt: str = ''
+	is_visible: bool = True
+	attributes: dict = field(default_factory=dict)
+
+
 class TestElementFinder:
 	"""Test ElementFinder semantic matching"""
 
@@ -18,25 +36,25 @@ class TestElementFinder:
 		self.finder = ElementFinder()
 
 	# Test 1: Find element by text_exact strategy
+	@pytest.mark.asyncio
 	async def test_find_by_text_exact(self):
 		"""Test finding element using text_exact strategy"""
 		# Mock browser session with DOM state
 		mock_session = Mock()
-		mock_state = Mock()
 
 		# Create mock DOM nodes
 		mock_nodes = {
-			1: Mock(text='Cancel', tag_name='button'),
-			2: Mock(text='Submit', tag_name='button'),  # Should match
-			3: Mock(text='Back', tag_name='a'),
+			1: FakeNode(text='Cancel', tag_name='button'),
+			2: FakeNode(text='Submit', tag_name='button'),  # Should match
+			3: FakeNode(text='Back', tag_name='a'),
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		# Strategy to find "Submit"
 		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, strategy_used = result
@@ -44,145 +62,145 @@ class TestElementFinder:
 		assert strategy_used['type'] == 'text_exact', 'Should use text_exact strategy'
 
 	# Test 2: Find element by role_text strategy
+	@pytest.mark.asyncio
 	async def test_find_by_role_text(self):
 		"""Test finding element using role + text strategy"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		# Create mock DOM nodes
 		mock_nodes = {
-			1: Mock(text='Submit', tag_name='button', role='button'),  # Should match
-			2: Mock(text='Submit', tag_name='a', role='link'),  # Wrong role
+			1: FakeNode(text='Submit', tag_name='button', role='button'),  # Should match
+			2: FakeNode(text='Submit', tag_name='a', role='link'),  # Wrong role
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		# Strategy to find button with text "Submit"
 		strategies = [{'type': 'role_text', 'value': 'Submit', 'priority': 2, 'metadata': {'role': 'button'}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, strategy_used = result
 		assert index == 1, f'Expected index 1, got {index}'
 
 	# Test 3: Find element by aria_label strategy
+	@pytest.mark.asyncio
 	async def test_find_by_aria_label(self):
 		"""Test finding element using aria-label strategy"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		mock_nodes = {
-			1: Mock(aria_label='Close dialog', tag_name='button'),  # Should match
-			2: Mock(aria_label='Open menu', tag_name='button'),
+			1: FakeNode(aria_label='Close dialog', tag_name='button'),  # Should match
+			2: FakeNode(aria_label='Open menu', tag_name='button'),
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		strategies = [{'type': 'aria_label', 'value': 'Close dialog', 'priority': 3, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, _ = result
 		assert index == 1, f'Expected index 1, got {index}'
 
 	# Test 4: Find element by placeholder strategy
+	@pytest.mark.asyncio
 	async def test_find_by_placeholder(self):
 		"""Test finding element using placeholder strategy"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		mock_nodes = {
-			1: Mock(placeholder='Enter your name', tag_name='input'),
-			2: Mock(placeholder='Enter your email', tag_name='input'),  # Should match
+			1: FakeNode(placeholder='Enter your name', tag_name='input'),
+			2: FakeNode(placeholder='Enter your email', tag_name='input'),  # Should match
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		strategies = [{'type': 'placeholder', 'value': 'Enter your email', 'priority': 4, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, _ = result
 		assert index == 2, f'Expected index 2, got {index}'
 
 	# Test 5: Find element by title strategy
+	@pytest.mark.asyncio
 	async def test_find_by_title(self):
 		"""Test finding element using title attribute strategy"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		mock_nodes = {
-			1: Mock(title='Click to close', tag_name='button'),  # Should match
-			2: Mock(title='Click to submit', tag_name='button'),
+			1: FakeNode(title='Click to close', tag_name='button'),  # Should match
+			2: FakeNode(title='Click to submit', tag_name='button'),
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		strategies = [{'type': 'title', 'value': 'Click to close', 'priority': 5, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, _ = result
 		assert index == 1, f'Expected index 1, got {index}'
 
 	# Test 6: Find element by alt_text strategy
+	@pytest.mark.asyncio
 	async def test_find_by_alt_text(self):
 		"""Test finding element using alt text strategy (for images)"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		mock_nodes = {
-			1: Mock(alt='Company logo', tag_name='img'),  # Should match
-			2: Mock(alt='User avatar', tag_name='img'),
+			1: FakeNode(alt='Company logo', tag_name='img'),  # Should match
+			2: FakeNode(alt='User avatar', tag_name='img'),
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		strategies = [{'type': 'alt_text', 'value': 'Company logo', 'priority': 6, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, _ = result
 		assert index == 1, f'Expected index 1, got {index}'
 
 	# Test 7: Fuzzy text matching
+	@pytest.mark.asyncio
 	async def test_find_by_fuzzy_text(self):
 		"""Test finding element using fuzzy text matching"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		# "Submit" vs "Submit Form" has ratio 0.70, so use lower threshold or closer match
 		mock_nodes = {
-			1: Mock(text='Submitt', tag_name='button'),  # Typo - ratio ~0.92, should match with threshold 0.8
+			1: FakeNode(text='Submitt', tag_name='button'),  # Typo - ratio ~0.92, should match with threshold 0.8
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		strategies = [{'type': 'text_fuzzy', 'value': 'Submit', 'priority': 7, 'metadata': {'threshold': 0.8}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element with fuzzy matching'
 		index, _ = result
 		assert index == 1, f'Expected index 1, got {index}'
 
 	# Test 8: Multiple strategies fallback (priority order)
+	@pytest.mark.asyncio
 	async def test_multiple_strategies_fallback(self):
 		"""Test that strategies are tried in priority order (lower priority = try first)"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		mock_nodes = {
-			1: Mock(text='Not this one', tag_name='button', aria_label='Close'),
-			2: Mock(text='Submit', tag_name='button', aria_label='Submit'),  # Should match on text_exact (priority 1)
+			1: FakeNode(text='Not this one', tag_name='button', aria_label='Close'),
+			2: FakeNode(text='Submit', tag_name='button', aria_label='Submit'),  # Should match on text_exact (priority 1)
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		# Strategies in reverse order (should still try priority 1 first)
 		strategies = [
@@ -190,7 +208,7 @@ class TestElementFinder:
 			{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}},  # Should match index 2 first
 		]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is not None, 'Should find element'
 		index, strategy_used = result
@@ -199,61 +217,64 @@ class TestElementFinder:
 		assert strategy_used['type'] == 'text_exact', 'Should use highest priority strategy'
 
 	# Test 9: No match returns None
+	@pytest.mark.asyncio
 	async def test_no_match_returns_none(self):
 		"""Test that None is returned when no strategy matches"""
 		mock_session = Mock()
-		mock_state = Mock()
 
 		mock_nodes = {
-			1: Mock(text='Cancel', tag_name='button'),
-			2: Mock(text='Back', tag_name='a'),
+			1: FakeNode(text='Cancel', tag_name='button'),
+			2: FakeNode(text='Back', tag_name='a'),
 		}
-		mock_state.selector_map = mock_nodes
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value=mock_nodes)
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		# Strategy looking for non-existent text
 		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is None, 'Should return None when no match found'
 
 	# Test 10: Empty strategies list returns None
+	@pytest.mark.asyncio
 	async def test_empty_strategies_returns_none(self):
 		"""Test that None is returned when strategies list is empty"""
 		mock_session = Mock()
 
-		result = await self.finder.find_element_with_strategies([], mock_session)
+		result, _ = await self.finder.find_element_with_strategies([], mock_session)
 
 		assert result is None, 'Should return None for empty strategies'
 
 	# Test 11: No DOM state returns None
+	@pytest.mark.asyncio
 	async def test_no_dom_state_returns_none(self):
-		"""Test that None is returned when DOM state is not available"""
+		"""Test that None is returned when no page is available"""
 		mock_session = Mock()
-		mock_session.get_state = AsyncMock(return_value=None)
+		mock_session.get_current_page = AsyncMock(return_value=None)
 
 		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
-		assert result is None, 'Should return None when DOM state is not available'
+		assert result is None, 'Should return None when no page is available'
 
 	# Test 12: Empty selector_map returns None
+	@pytest.mark.asyncio
 	async def test_empty_selector_map_returns_none(self):
 		"""Test that None is returned when selector_map is empty"""
 		mock_session = Mock()
-		mock_state = Mock()
-		mock_state.selector_map = {}  # Empty
-		mock_session.get_state = AsyncMock(return_value=mock_state)
+		mock_session.get_selector_map = AsyncMock(return_value={})
+		mock_session.get_current_page = AsyncMock(return_value=Mock())
 
 		strategies = [{'type': 'text_exact', 'value': 'Submit', 'priority': 1, 'metadata': {}}]
 
-		result = await self.finder.find_element_with_strategies(strategies, mock_session)
+		result, _ = await self.finder.find_element_with_strategies(strategies, mock_session)
 
 		assert result is None, 'Should return None when selector_map is empty'
 
 	# Test 13: Fuzzy matching threshold
+	@pytest.mark.asyncio
 	async def test_fuzzy_matching_threshold(self):
 		"""Test that fuzzy matching respects threshold"""
 		# Test _fuzzy_match directly
@@ -272,20 +293,66 @@ class TestElementFinder:
 		assert not self.finder._fuzzy_match('Submit', 'Completely Different', 0.8), 'Very different should fail'
 
 	# Test 14: Case insensitivity in fuzzy matching
+	@pytest.mark.asyncio
 	async def test_fuzzy_matching_case_insensitive(self):
 		"""Test that fuzzy matching is case insensitive"""
 		assert self.finder._fuzzy_match('Submit', 'SUBMIT', 0.9), 'Should be case insensitive'
 		assert self.finder._fuzzy_match('Submit', 'submit', 0.9), 'Should be case insensitive'
 
 
-# Helper to run async tests
-import asyncio
+class TestSelectorMapSnapshot:
+	"""The column snapshot must follow in-place updates of browser-use's cached selector map"""
+
+	@pytest.mark.asyncio
+	async def test_same_dict_with_replaced_node_is_rescanned(self):
+		"""Replacing a node in place, keeping the map's size, must not return the stale node"""
+		finder = ElementFinder()
+		selector_map = {1: FakeNode(text='Cancel'), 2: FakeNode(text='Submit')}
+
+		result = await finder._find_with_semantic_strategy('text_exact', 'Submit', {}, selector_map)
+		assert result is not None and result[0] == 2
+
+		# Same dict object and same length, new content
+		selector_map[2] = FakeNode(text='Next')
+		selector_map[1] = FakeNode(text='Submit')
 
+		result = await finder._find_with_semantic_strategy('text_exact', 'Submit', {}, selector_map)
+		assert result is not None, 'Should find the element in the updated map'
+		index, node = result
+		assert index == 1, f'Expected index 1 after the update, got {index}'
+		assert node is selector_map[1], 'Should return the current node, not the one from the old snapshot'
 
-def run_async_test(test_method):
-	"""Helper to run async test methods"""
-	return asyncio.run(test_method())
+	@pytest.mark.asyncio
+	async def test_same_dict_with_reindexed_nodes_is_rescanned(self):
+		"""Swapping which index holds which node is picked up too"""
+		finder = ElementFinder()
+		submit = FakeNode(text='Submit')
+		selector_map = {1: submit, 2: FakeNode(text='Cancel')}
 
+		result = await finder._find_with_semantic_strategy('text_exact', 'Submit', {}, selector_map)
+		assert result is not None and result[0] == 1
+
+		selector_map.clear()
+		selector_map.update({1: FakeNode(text='Cancel'), 3: submit})
+
+		result = await finder._find_with_semantic_strategy('text_exact', 'Submit', {}, selector_map)
+		assert result is not None and result[0] == 3
+
+	@pytest.mark.asyncio
+	async def test_unchanged_map_reuses_snapshot(self):
+		"""An unchanged map keeps its snapshot, so repeated strategies skip the rebuild"""
+		finder = ElementFinder()
+		selector_map = {1: FakeNode(text='Submit', aria_label='Send')}
+
+		await finder._find_with_semantic_strategy('text_exact', 'Submit', {}, selector_map)
+		snapshot = finder._snapshot_columns
+		result = await finder._find_with_semantic_strategy('aria_label', 'Send', {}, dict(selector_map))
+
+		assert result is not None and result[0] == 1
+		assert finder._snapshot_columns is snapshot
+
+
+import asyncio
 
 if __name__ == '__main__':
 	# Run all tests
@@ -299,29 +366,31 @@ if __name__ == '__main__':
 	passed = 0
 	failed = 0
 
-	for method_name in test_methods:
-		test.setup_method()  # Setup for each test
-		method = getattr(test, method_name)
-		try:
-			# Run async or sync test
-			if asyncio.iscoroutinefunction(method):
-				run_async_test(method)
-			else:
-				method()
-
-			print(f'✅ PASS: {method_name}')
-			passed += 1
-		except AssertionError as e:
-			print(f'❌ FAIL: {method_name}')
-			print(f'   {str(e)}')
-			failed += 1
-		except Exception as e:
-			print(f'❌ ERROR: {method_name}')
-			print(f'   {str(e)}')
-			import traceback
-
-			traceback.print_exc()
-			failed += 1
+	# One event loop for the whole run instead of a fresh asyncio.run() loop per test
+	with asyncio.Runner() as runner:
+		for method_name in test_methods:
+			test.setup_method()  # Setup for each test
+			method = getattr(test, method_name)
+			try:
+				# Run async or sync test
+				if asyncio.iscoroutinefunction(method):
+					runner.run(method())
+				else:
+					method()
+
+				print(f'✅ PASS: {method_name}')
+				passed += 1
+			except AssertionError as e:
+				print(f'❌ FAIL: {method_name}')
+				print(f'   {str(e)}')
+				failed += 1
+			except Exception as e:
+				print(f'❌ ERROR: {method_name}')
+				print(f'   {str(e)}')
+				import traceback
+
+				traceback.print_exc()
+				failed += 1
 
 	print(f'\n{"=" * 80}')
 	print(f'Test Results: {passed} passed, {failed} failed')
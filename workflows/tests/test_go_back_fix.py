@@ -3,6 +3,7 @@ Quick test to verify go_back action works with NoParamsAction fix.
 """
 
 import asyncio
+import tempfile
 from pathlib import Path
 
 import yaml
@@ -27,9 +28,10 @@ async def test_go_back_fix():
 		],
 	}
 
-	# Write to YAML file
-	workflow_path = Path('test_go_back.workflow.yaml')
-	workflow_path.write_text(yaml.dump(workflow_dict))
+	# Write to a unique temp file so parallel test workers never share it
+	with tempfile.NamedTemporaryFile('w', suffix='.workflow.yaml', delete=False) as f:
+		yaml.dump(workflow_dict, f)
+	workflow_path = Path(f.name)
 
 	print('✅ Created test workflow')
 
@@ -52,8 +54,6 @@ async def test_go_back_fix():
 		print('\n✅ Workflow completed!')
 		print(f'📊 Result: {result}')
 
-		# Clean up
-		workflow_path.unlink()
 		print('\n✨ Test passed - go_back action works correctly!')
 
 	except Exception as e:
@@ -62,6 +62,10 @@ async def test_go_back_fix():
 
 		traceback.print_exc()
 
+	finally:
+		# Clean up
+		workflow_path.unlink(missing_ok=True)
+
 
 if __name__ == '__main__':
 	asyncio.run(test_go_back_fix())
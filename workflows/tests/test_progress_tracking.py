@@ -2,32 +2,15 @@
 Unit tests for progress tracking callbacks in HealingService.
 
 Usage:
-    python tests/test_progress_tracking.py
+    pytest -n auto tests/test_progress_tracking.py
 """
 
+import asyncio
 from typing import Any, Dict
-from unittest.mock import AsyncMock, Mock
 
-try:
-	import pytest
+import pytest
 
-	HAS_PYTEST = True
-except ImportError:
-	HAS_PYTEST = False
-
-	# Mock pytest.mark.skip for standalone execution
-	class _MockPytest:
-		class mark:
-			@staticmethod
-			def skip(*args, **kwargs):
-				def decorator(func):
-					return func
-
-				return decorator
-
-	pytest = _MockPytest()
-
-from workflow_use.healing.service import HealingService
+from workflow_use.healing.service import HealingService, _StepBatcher
 
 
 class TestProgressTracking:
@@ -43,8 +26,9 @@ class TestProgressTracking:
 
 	def test_step_callback_data_structure(self):
 		"""Test that step callback receives correct data structure."""
-		# Mock callback to capture data
-		step_callback = Mock()
+		# Capture callback data in a plain list
+		calls = []
+		step_callback = calls.append
 
 		# Simulate what the callback would receive
 		expected_data = {
@@ -61,8 +45,8 @@ class TestProgressTracking:
 		step_callback(expected_data)
 
 		# Verify callback was called with correct structure
-		assert step_callback.called
-		call_args = step_callback.call_args[0][0]
+		assert calls
+		call_args = calls[-1]
 		assert 'step_number' in call_args
 		assert 'action_type' in call_args
 		assert 'description' in call_args
@@ -71,7 +55,8 @@ class TestProgressTracking:
 
 	def test_status_callback_messages(self):
 		"""Test that status callback receives expected messages."""
-		status_callback = Mock()
+		calls = []
+		status_callback = calls.append
 
 		# Expected status messages
 		expected_statuses = [
@@ -89,7 +74,7 @@ class TestProgressTracking:
 			status_callback(status)
 
 		# Verify all statuses were called
-		assert status_callback.call_count == len(expected_statuses)
+		assert len(calls) == len(expected_statuses)
 
 	def test_callbacks_are_optional(self):
 		"""Test that callbacks are truly optional (backward compatibility)."""
@@ -120,27 +105,42 @@ class TestProgressTracking:
 			# Here we just verify it would be raised
 			assert str(e) == 'Callback error!'
 
-	def test_async_callback_pattern(self):
-		"""Test that async callbacks can be wrapped with create_task."""
-		import asyncio
+	@pytest.mark.asyncio
+	async def test_async_callback_runs_as_tracked_task(self):
+		"""Async callbacks are passed as is; each call runs as a task that can be awaited at the end."""
+		from workflow_use.healing.service import _schedule_callback
+
+		received = []
 
-		async_callback = AsyncMock()
+		async def async_callback(data):
+			await asyncio.sleep(0)
+			received.append(data)
 
-		# Pattern used in examples
-		wrapper = lambda data: asyncio.create_task(async_callback(data))
+		tasks = set()
+		_schedule_callback(async_callback({'step_number': 1}), tasks)
+		_schedule_callback(async_callback({'step_number': 2}), tasks)
+		assert tasks, 'In-flight callback tasks should be tracked until they finish'
 
-		# Verify wrapper is callable
-		assert callable(wrapper)
+		await asyncio.gather(*tasks, return_exceptions=True)
+		assert received == [{'step_number': 1}, {'step_number': 2}]
+		assert not tasks, 'Finished callback tasks should be dropped from the tracked set'
 
-		# Test in async context
-		async def test_async():
-			task = wrapper({'step_number': 1})
-			assert isinstance(task, asyncio.Task)
-			await task
-			assert async_callback.called
+	@pytest.mark.asyncio
+	async def test_async_callback_errors_are_reported(self, capsys):
+		"""An exception raised inside an async callback task is reported instead of being lost."""
+		from workflow_use.healing.service import _schedule_callback
 
-		# Run test
-		asyncio.run(test_async())
+		async def failing_callback(data):
+			await asyncio.sleep(0)
+			raise RuntimeError('Callback error!')
+
+		tasks = set()
+		task = _schedule_callback(failing_callback({'step_number': 1}), tasks)
+		await asyncio.gather(*tasks, return_exceptions=True)
+		await asyncio.sleep(0)  # Done callbacks run on the next loop iteration
+
+		assert task.done()
+		assert 'Callback error!' in capsys.readouterr().out
 
 	def test_step_action_types(self):
 		"""Test that all expected action types are covered."""
@@ -168,12 +168,15 @@ class TestProgressTracking:
 		"""Test that timestamp is ISO 8601 format."""
 		from datetime import datetime, timezone
 
-		# Generate timestamp like the implementation does
-		timestamp = datetime.now(timezone.utc).isoformat()
+		from workflow_use.healing.service import _now_iso
+
+		# Generate timestamp the way the implementation does
+		timestamp = _now_iso()
 
-		# Verify it's valid ISO 8601
+		# Verify it's valid ISO 8601, in UTC
 		parsed = datetime.fromisoformat(timestamp)
 		assert isinstance(parsed, datetime)
+		assert parsed.utcoffset() == timezone.utc.utcoffset(None)
 
 	def test_description_generation(self):
 		"""Test human-readable description generation logic."""
@@ -209,28 +212,11 @@ class TestProgressTracking:
 			},
 		]
 
-		# Simple implementation of _generate_action_description logic
-		def generate_description(action_type, target_text, input_value, url):
-			if action_type == 'navigation':
-				return f'Navigate to {url}'
-			elif action_type == 'click':
-				if target_text:
-					return f'Click on "{target_text}"'
-				return 'Click element'
-			elif action_type == 'input_text':
-				if target_text and input_value:
-					return f'Enter "{input_value}" into {target_text}'
-				elif input_value:
-					return f'Enter text: {input_value}'
-				return 'Input text'
-			elif action_type == 'extract':
-				return 'Extract page content'
-			else:
-				return f'Execute action: {action_type or "unknown"}'
+		from workflow_use.healing.service import _describe_action
 
 		# Verify descriptions
 		for test_case in test_cases:
-			result = generate_description(
+			result = _describe_action(
 				test_case['action_type'],
 				test_case['target_text'],
 				test_case['input_value'],
@@ -239,6 +225,73 @@ class TestProgressTracking:
 			assert result == test_case['expected'], f'Failed for {test_case["action_type"]}'
 
 
+class TestStepBatcher:
+	"""Tests for the batching of step callbacks (batch_size > 1)."""
+
+	@pytest.mark.asyncio
+	async def test_flushes_when_batch_is_full(self):
+		"""A full batch is delivered without waiting for the flush interval."""
+		batches = []
+		batcher = _StepBatcher(batches.append, batch_size=2, flush_interval=60)
+		batcher.start()
+
+		batcher.add({'step_number': 1})
+		batcher.add({'step_number': 2})
+		for _ in range(5):
+			await asyncio.sleep(0)
+
+		assert batches == [[{'step_number': 1}, {'step_number': 2}]]
+		await batcher.close()
+
+	@pytest.mark.asyncio
+	async def test_flushes_partial_batch_after_interval(self):
+		"""A partial batch is delivered once the flush interval has passed."""
+		batches = []
+		batcher = _StepBatcher(batches.append, batch_size=10, flush_interval=0.01)
+		batcher.start()
+
+		batcher.add({'step_number': 1})
+		await asyncio.sleep(0.05)
+
+		assert batches == [[{'step_number': 1}]]
+		await batcher.close()
+
+	@pytest.mark.asyncio
+	async def test_close_delivers_pending_steps(self):
+		"""Steps still pending when recording ends are delivered by close()."""
+		batches = []
+		batcher = _StepBatcher(batches.append, batch_size=10, flush_interval=60)
+		batcher.start()
+
+		batcher.add({'step_number': 1})
+		batcher.add({'step_number': 2})
+		await batcher.close()
+
+		assert batches == [[{'step_number': 1}, {'step_number': 2}]]
+
+	@pytest.mark.asyncio
+	async def test_close_waits_for_in_flight_async_callback(self):
+		"""close() lets a batch whose async callback is still running finish instead of cancelling it."""
+		delivered = []
+		started = asyncio.Event()
+
+		async def slow_callback(batch):
+			started.set()
+			await asyncio.sleep(0.01)
+			delivered.append(batch)
+
+		batcher = _StepBatcher(slow_callback, batch_size=2, flush_interval=60)
+		batcher.start()
+
+		batcher.add({'step_number': 1})
+		batcher.add({'step_number': 2})
+		await started.wait()
+		batcher.add({'step_number': 3})
+		await batcher.close()
+
+		assert delivered == [[{'step_number': 1}, {'step_number': 2}], [{'step_number': 3}]]
+
+
 class TestProgressTrackingIntegration:
 	"""Integration tests (require actual workflow generation - run manually)."""
 
@@ -290,52 +343,3 @@ class TestProgressTrackingIntegration:
 		print(f'   Steps recorded: {len(steps_recorded)}')
 		print(f'   Status updates: {len(statuses_recorded)}')
 		print(f'   Workflow steps: {len(workflow.steps)}')
-
-
-if __name__ == '__main__':
-	# Run basic tests
-	print('Running progress tracking tests...')
-
-	test = TestProgressTracking()
-
-	print('\n1. Testing callback signature...')
-	test.test_callback_signature()
-	print('   ✓ Passed')
-
-	print('\n2. Testing step callback data structure...')
-	test.test_step_callback_data_structure()
-	print('   ✓ Passed')
-
-	print('\n3. Testing status callback messages...')
-	test.test_status_callback_messages()
-	print('   ✓ Passed')
-
-	print('\n4. Testing callbacks are optional...')
-	test.test_callbacks_are_optional()
-	print('   ✓ Passed')
-
-	print('\n5. Testing callback exception handling...')
-	test.test_callback_exception_handling()
-	print('   ✓ Passed')
-
-	print('\n6. Testing async callback pattern...')
-	test.test_async_callback_pattern()
-	print('   ✓ Passed')
-
-	print('\n7. Testing step action types...')
-	test.test_step_action_types()
-	print('   ✓ Passed')
-
-	print('\n8. Testing timestamp format...')
-	test.test_timestamp_format()
-	print('   ✓ Passed')
-
-	print('\n9. Testing description generation...')
-	test.test_description_generation()
-	print('   ✓ Passed')
-
-	print('\n' + '=' * 80)
-	print('✅ All unit tests passed!')
-	print('=' * 80)
-	print('\nNote: Integration tests are skipped (require API keys and browser).')
-	print('To run integration tests manually, uncomment the test and run with pytest.')
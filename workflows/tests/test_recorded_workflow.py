@@ -1,21 +1,30 @@
-"""Test recorded workflow execution"""
+"""Test recorded workflow execution
+
+Usage:
+    python tests/test_recorded_workflow.py [recording.json ...]
+
+All recordings given on the command line run concurrently on one event loop.
+"""
 
 import asyncio
 import logging
+import sys
 
 from browser_use.llm import ChatBrowserUse
 
+from workflow_use.healing.service import _start_task
 from workflow_use.workflow.service import Workflow
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DEFAULT_RECORDING = 'tmp/temp_recording_kn1yz829.json'
 
-async def main():
-	llm = ChatBrowserUse(model='bu-latest')
-	workflow = Workflow.load_from_file('tmp/temp_recording_kn1yz829.json', llm)
 
-	logger.info('Starting workflow execution...')
+async def run_recording(path: str, llm: ChatBrowserUse):
+	workflow = Workflow.load_from_file(path, llm)
+
+	logger.info(f'Starting workflow execution: {path}')
 	try:
 		result = await workflow.run(inputs={}, close_browser_at_end=False)
 		logger.info(f'✅ Workflow completed: {result}')
@@ -23,5 +32,11 @@ async def main():
 		logger.error(f'❌ Workflow failed: {e}', exc_info=True)
 
 
+async def main(paths: list[str]):
+	llm = ChatBrowserUse(model='bu-latest')
+	# Recording tasks start eagerly (Python 3.12+), so one that fails fast never waits for a loop iteration
+	await asyncio.gather(*[_start_task(run_recording(path, llm)) for path in paths])
+
+
 if __name__ == '__main__':
-	asyncio.run(main())
+	asyncio.run(main(sys.argv[1:] or [DEFAULT_RECORDING]))
@@ -5,24 +5,64 @@ This module generates multiple fallback strategies to find elements on a page,
 reducing dependence on AI and making workflows more deterministic.
 """
 
+import functools
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from workflow_use.healing.xpath_optimizer import XPathOptimizer
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Highest (least preferred) priority any generated strategy can have; see _calculate_xpath_priority
+_MAX_PRIORITY = 10
+
+# Implicit ARIA role of an element by tag name
+_TAG_ROLES = {
+	'button': 'button',
+	'a': 'link',
+	'input': 'textbox',
+	'textarea': 'textbox',
+	'select': 'combobox',
+	'h1': 'heading',
+	'h2': 'heading',
+	'h3': 'heading',
+	'h4': 'heading',
+	'h5': 'heading',
+	'h6': 'heading',
+	'img': 'img',
+	'table': 'table',
+	'ul': 'list',
+	'ol': 'list',
+	'nav': 'navigation',
+}
+
+# <input> types whose role differs from the 'textbox' default
+_INPUT_TYPE_ROLES = {
+	'checkbox': 'checkbox',
+	'radio': 'radio',
+	'submit': 'button',
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SelectorStrategy:
-	"""A single selector strategy with priority and metadata."""
+	"""A single selector strategy with priority and metadata (immutable, so cached instances can be shared)."""
 
 	type: str  # Strategy type: 'id', 'css_attr', 'text_exact', 'aria', etc.
 	value: str  # The selector value or matching text
 	priority: int  # Lower = try first (1 is highest priority)
-	metadata: Dict[str, Any] = field(default_factory=dict)  # Extra info for matching
+	metadata: Mapping[str, Any] = field(default_factory=dict)  # Extra info for matching (read-only)
+
+	def __post_init__(self) -> None:
+		# Types come from a small vocabulary; interning makes strategies loaded from JSON share one string per type
+		object.__setattr__(self, 'type', sys.intern(self.type))
+		# Cached strategies are handed to every caller, so their metadata must not be mutable either
+		if not isinstance(self.metadata, MappingProxyType):
+			object.__setattr__(self, 'metadata', MappingProxyType(dict(self.metadata)))
 
 	def to_dict(self) -> Dict[str, Any]:
 		"""Convert to dictionary for JSON serialization."""
@@ -30,7 +70,7 @@ class SelectorStrategy:
 			'type': self.type,
 			'value': self.value,
 			'priority': self.priority,
-			'metadata': self.metadata,
+			'metadata': dict(self.metadata),
 		}
 
 	@classmethod
@@ -81,6 +121,9 @@ class SelectorGenerator:
 		self.max_total_strategies = max_total_strategies
 		self.xpath_optimizer = XPathOptimizer() if enable_xpath_optimization else None
 
+		# Strategies per element fingerprint; elements recorded on a page often repeat (same buttons, links)
+		self._generate_cached = functools.lru_cache(maxsize=2048)(self._generate_strategies)
+
 	def generate_strategies(self, element_data: Dict[str, Any], include_xpath_fallback: bool = True) -> List[SelectorStrategy]:
 		"""
 		Generate selector strategies from captured element data.
@@ -110,26 +153,53 @@ class SelectorGenerator:
 		    ... )
 		    >>> # Returns: text_exact, role_text, aria_label, text_fuzzy, xpath
 		"""
-		strategies = []
-		tag = element_data.get('tag_name', '').lower()
+		tag = sys.intern(element_data.get('tag_name', '').lower())
 		text = element_data.get('text', '').strip()
 		attrs = element_data.get('attributes', {})
+		xpath = element_data.get('xpath') or ''
+
+		# Nothing to build a semantic strategy or an xpath from, whatever the tag (common for bare containers)
+		if not text and not attrs and not xpath:
+			return []
+
+		# Attribute order is kept in the key since it decides which data-* attribute the fallback XPath uses
+		try:
+			return list(self._generate_cached(tag, text, tuple(attrs.items()), xpath, include_xpath_fallback))
+		except TypeError:
+			# Unhashable attribute values cannot be part of the cache key
+			return list(self._generate_strategies(tag, text, tuple(attrs.items()), xpath, include_xpath_fallback))
+
+	def _generate_strategies(
+		self, tag: str, text: str, attrs_items: Tuple[Tuple[str, Any], ...], xpath: str, include_xpath_fallback: bool
+	) -> Tuple[SelectorStrategy, ...]:
+		"""Build the strategies for one element fingerprint; memoized per instance as _generate_cached."""
+		attrs = dict(attrs_items)
+
+		# One bucket per priority value: appending in generation order and concatenating the buckets
+		# gives the same order as a stable sort by priority, without sorting
+		buckets: List[List[SelectorStrategy]] = [[] for _ in range(_MAX_PRIORITY + 1)]
+
+		def add(strategy: SelectorStrategy) -> None:
+			buckets[strategy.priority].append(strategy)
+
+		# Strategy metadata is read-only, so the tag-only strategies can share one mapping instead of building one each
+		tag_meta = MappingProxyType({'tag': tag})
 
 		# Strategy 1: Exact text match (highest priority - most reliable)
 		if text:
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='text_exact',
 					value=text,
 					priority=1,
-					metadata={'tag': tag},
+					metadata=tag_meta,
 				)
 			)
 
 		# Strategy 2: Role + text (semantic HTML)
 		role = self._infer_role(tag, attrs)
 		if role and text:
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='role_text',
 					value=text,
@@ -140,51 +210,51 @@ class SelectorGenerator:
 
 		# Strategy 3: ARIA label (accessibility-based)
 		if 'aria-label' in attrs and attrs['aria-label']:
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='aria_label',
 					value=attrs['aria-label'],
 					priority=3,
-					metadata={'tag': tag},
+					metadata=tag_meta,
 				)
 			)
 
 		# Strategy 4: Placeholder (for input fields)
 		if 'placeholder' in attrs and attrs['placeholder']:
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='placeholder',
 					value=attrs['placeholder'],
 					priority=4,
-					metadata={'tag': tag},
+					metadata=tag_meta,
 				)
 			)
 
 		# Strategy 5: Title attribute (tooltip text)
 		if 'title' in attrs and attrs['title']:
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='title',
 					value=attrs['title'],
 					priority=5,
-					metadata={'tag': tag},
+					metadata=tag_meta,
 				)
 			)
 
 		# Strategy 6: Alt text (for images)
 		if 'alt' in attrs and attrs['alt']:
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='alt_text',
 					value=attrs['alt'],
 					priority=6,
-					metadata={'tag': tag},
+					metadata=tag_meta,
 				)
 			)
 
 		# Strategy 7: Fuzzy text match (fallback - handles typos/variations)
 		if text and len(text) > 3:  # Only for meaningful text
-			strategies.append(
+			add(
 				SelectorStrategy(
 					type='text_fuzzy',
 					value=text,
@@ -197,7 +267,7 @@ class SelectorGenerator:
 		if include_xpath_fallback:
 			if self.enable_xpath_optimization and self.xpath_optimizer:
 				# NEW: Use XPathOptimizer to generate multiple robust XPath alternatives
-				absolute_xpath = element_data.get('xpath', '')
+				absolute_xpath = xpath
 
 				if absolute_xpath:
 					# Prepare element info for optimizer
@@ -227,7 +297,7 @@ class SelectorGenerator:
 							# Determine strategy type
 							strategy_name = self._determine_xpath_strategy(opt_xpath)
 
-							strategies.append(
+							add(
 								SelectorStrategy(
 									type='xpath',
 									value=opt_xpath,
@@ -245,7 +315,7 @@ class SelectorGenerator:
 						# Fall back to simple XPath generation
 						xpath = self._generate_xpath(tag, text, attrs)
 						if xpath:
-							strategies.append(
+							add(
 								SelectorStrategy(
 									type='xpath',
 									value=xpath,
@@ -257,7 +327,7 @@ class SelectorGenerator:
 					# No absolute xpath available, generate one
 					xpath = self._generate_xpath(tag, text, attrs)
 					if xpath:
-						strategies.append(
+						add(
 							SelectorStrategy(
 								type='xpath',
 								value=xpath,
@@ -267,10 +337,10 @@ class SelectorGenerator:
 						)
 			else:
 				# XPath optimization disabled, use original behavior
-				xpath = element_data.get('xpath') or self._generate_xpath(tag, text, attrs)
+				xpath = xpath or self._generate_xpath(tag, text, attrs)
 
 				if xpath:
-					strategies.append(
+					add(
 						SelectorStrategy(
 							type='xpath',
 							value=xpath,
@@ -279,15 +349,15 @@ class SelectorGenerator:
 						)
 					)
 
-		# Sort by priority (lower number = higher priority)
-		strategies.sort(key=lambda s: s.priority)
+		# Flatten by priority (lower number = higher priority)
+		strategies = [strategy for bucket in buckets for strategy in bucket]
 
 		# Limit total number of strategies if configured
 		if self.max_total_strategies and len(strategies) > self.max_total_strategies:
 			logger.debug(f'Limiting strategies from {len(strategies)} to {self.max_total_strategies} (keeping highest priority)')
 			strategies = strategies[: self.max_total_strategies]
 
-		return strategies
+		return tuple(strategies)
 
 	def _infer_role(self, tag: str, attrs: Dict[str, Any]) -> Optional[str]:
 		"""
@@ -304,37 +374,13 @@ class SelectorGenerator:
 		if 'role' in attrs:
 			return attrs['role']
 
-		# Infer from HTML tag
-		role_map = {
-			'button': 'button',
-			'a': 'link',
-			'input': 'textbox',
-			'textarea': 'textbox',
-			'select': 'combobox',
-			'h1': 'heading',
-			'h2': 'heading',
-			'h3': 'heading',
-			'h4': 'heading',
-			'h5': 'heading',
-			'h6': 'heading',
-			'img': 'img',
-			'table': 'table',
-			'ul': 'list',
-			'ol': 'list',
-			'nav': 'navigation',
-		}
-
 		# Special case for input types
 		if tag == 'input' and 'type' in attrs:
-			input_type = attrs['type'].lower()
-			if input_type == 'checkbox':
-				return 'checkbox'
-			elif input_type == 'radio':
-				return 'radio'
-			elif input_type == 'submit':
-				return 'button'
+			role = _INPUT_TYPE_ROLES.get(attrs['type'].lower())
+			if role:
+				return role
 
-		return role_map.get(tag)
+		return _TAG_ROLES.get(tag)
 
 	def _generate_xpath(self, tag: str, text: str, attrs: Dict[str, Any]) -> Optional[str]:
 		"""
@@ -478,7 +524,10 @@ class SelectorGenerator:
 		"""Escape quotes in CSS selector values."""
 		return value.replace("'", "\\'").replace('"', '\\"')
 
-	def _calculate_xpath_priority(self, xpath: str, is_absolute: bool = False) -> int:
+	# Both classifiers are pure functions of the xpath string, so results are shared across instances
+	@staticmethod
+	@functools.lru_cache(maxsize=2048)
+	def _calculate_xpath_priority(xpath: str, is_absolute: bool = False) -> int:
 		"""
 		Calculate priority score based on XPath characteristics.
 
@@ -538,7 +587,9 @@ class SelectorGenerator:
 		# Default: medium priority
 		return 5
 
-	def _determine_xpath_strategy(self, xpath: str) -> str:
+	@staticmethod
+	@functools.lru_cache(maxsize=2048)
+	def _determine_xpath_strategy(xpath: str) -> str:
 		"""
 		Determine the strategy type/name based on XPath characteristics.
 
@@ -602,6 +653,24 @@ class SelectorGenerator:
 		strategies = self.generate_strategies(element_data)
 		return [s.to_dict() for s in strategies]
 
+	def generate_strategies_map(self, element_data: Dict[str, Any]) -> Dict[str, SelectorStrategy]:
+		"""
+		Generate strategies keyed by strategy type.
+
+		When several strategies share a type (e.g. multiple xpath alternatives), the highest-priority one
+		is kept. Values stay in priority order.
+
+		Args:
+		    element_data: Element data dictionary
+
+		Returns:
+		    Dict mapping strategy type to its best SelectorStrategy
+		"""
+		strategies_by_type: Dict[str, SelectorStrategy] = {}
+		for strategy in self.generate_strategies(element_data):
+			strategies_by_type.setdefault(strategy.type, strategy)
+		return strategies_by_type
+
 	def get_summary(self, strategies: List[SelectorStrategy]) -> str:
 		"""
 		Get a human-readable summary of strategies.
@@ -1,8 +1,13 @@
+import asyncio
+import contextlib
 import hashlib
+import inspect
 import json
+import sys
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Union
 
 import aiofiles
 from browser_use import Agent, AgentHistoryList, Browser
@@ -18,13 +23,133 @@ from workflow_use.healing.variable_extractor import VariableExtractor
 from workflow_use.healing.views import ParsedAgentStep, SimpleDomElement, SimpleResult
 from workflow_use.schema.views import WorkflowDefinitionSchema
 
-# Type definitions for progress tracking callbacks
-StepRecordedCallback = Callable[[Dict[str, Any]], None]
+# Type definitions for progress tracking callbacks; with batch_size > 1 the step callback receives a list of steps
+StepRecordedCallback = Callable[[Union[Dict[str, Any], List[Dict[str, Any]]]], Union[None, Awaitable[None]]]
 StatusUpdateCallback = Callable[[str], None]
 
 # Get the absolute path to the prompts directory
 _PROMPTS_DIR = Path(__file__).parent / 'prompts'
 
+_UTC = timezone.utc
+
+
+def _describe_input(target_text: Optional[str], input_value: Optional[str], url: str) -> str:
+	if target_text and input_value:
+		return f'Enter "{input_value}" into {target_text}'
+	elif input_value:
+		return f'Enter text: {input_value}'
+	return 'Input text'
+
+
+# Human-readable step description per recorded action type: (target_text, input_value, url) -> str
+_ACTION_DESCRIPTIONS: Dict[str, Callable[[Optional[str], Optional[str], str], str]] = {
+	'navigation': lambda target_text, input_value, url: f'Navigate to {url}',
+	'click': lambda target_text, input_value, url: f'Click on "{target_text}"' if target_text else 'Click element',
+	'input_text': _describe_input,
+	'extract': lambda target_text, input_value, url: 'Extract page content',
+	'keypress': lambda target_text, input_value, url: f'Press keys: {input_value}' if input_value else 'Press keys',
+	'scroll': lambda target_text, input_value, url: 'Scroll page',
+}
+
+
+def _describe_action(action_type: Optional[str], target_text: Optional[str], input_value: Optional[str], url: str) -> str:
+	"""Generate a human-readable description of a recorded action."""
+	describe = _ACTION_DESCRIPTIONS.get(action_type)
+	if describe is None:
+		return f'Execute action: {action_type or "unknown"}'
+	return describe(target_text, input_value, url)
+
+
+def _start_task(coro: Awaitable[Any]) -> asyncio.Task:
+	"""Start a coroutine as a task on the running loop.
+
+	On Python 3.12+ the task starts eagerly: a coroutine that never blocks finishes right here, without
+	waiting for a loop iteration. Only these tasks are affected; the loop's task factory is left alone.
+	"""
+	if sys.version_info >= (3, 12):
+		return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+	return asyncio.create_task(coro)
+
+
+def _report_callback_error(task: asyncio.Task) -> None:
+	"""Done callback for step-callback tasks: report the exception a task ended with instead of dropping it."""
+	if not task.cancelled() and task.exception() is not None:
+		print(f'⚠️  Warning: Failed to fire step recorded callback: {task.exception()}')
+
+
+def _schedule_callback(coro: Awaitable[Any], tasks: set) -> asyncio.Task:
+	"""Run an async step callback as a task, kept in `tasks` until it finishes so it can be awaited at the end."""
+	task = _start_task(coro)
+	task.add_done_callback(_report_callback_error)
+	if not task.done():
+		tasks.add(task)
+		task.add_done_callback(tasks.discard)
+	return task
+
+
+def _now_iso() -> str:
+	"""Current UTC time as an ISO 8601 string with microseconds, e.g. 2025-01-31T12:00:00.000000+00:00."""
+	n = datetime.now(_UTC)
+	return f'{n.year:04d}-{n.month:02d}-{n.day:02d}T{n.hour:02d}:{n.minute:02d}:{n.second:02d}.{n.microsecond:06d}+00:00'
+
+
+class _StepBatcher:
+	"""Coalesce recorded steps into lists handed to `callback` in a single call.
+
+	A batch is flushed once `batch_size` steps are pending or `flush_interval` seconds have passed,
+	so a remote consumer sees one invocation per batch instead of one per step.
+	"""
+
+	def __init__(self, callback: Callable[[List[Dict[str, Any]]], Any], batch_size: int, flush_interval: float):
+		self._callback = callback
+		self._callback_is_async = inspect.iscoroutinefunction(callback)
+		self._batch_size = batch_size
+		self._flush_interval = flush_interval
+		self._pending: deque[Dict[str, Any]] = deque()
+		self._wakeup = asyncio.Event()
+		self._task: Optional[asyncio.Task] = None
+		self._stopping = False
+
+	def add(self, step_data: Dict[str, Any]) -> None:
+		self._pending.append(step_data)
+		if len(self._pending) >= self._batch_size:
+			self._wakeup.set()
+
+	def start(self) -> None:
+		self._task = asyncio.create_task(self._run())
+
+	async def _run(self) -> None:
+		while not self._stopping:
+			with contextlib.suppress(asyncio.TimeoutError):
+				await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+			self._wakeup.clear()
+			await self.flush()
+
+	async def flush(self) -> None:
+		if not self._pending:
+			return
+		batch = list(self._pending)
+		self._pending.clear()
+		try:
+			if self._callback_is_async:
+				await self._callback(batch)
+			else:
+				self._callback(batch)
+		except Exception as e:
+			print(f'⚠️  Warning: Failed to fire step recorded callback: {e}')
+
+	async def close(self) -> None:
+		"""Stop the flush loop and deliver whatever is still pending.
+
+		The loop is asked to stop rather than cancelled, so a batch whose callback is in flight is delivered in full.
+		"""
+		self._stopping = True
+		self._wakeup.set()
+		if self._task is not None:
+			await self._task
+			self._task = None
+		await self.flush()
+
 
 class HealingService:
 	def __init__(
@@ -425,6 +550,8 @@ class HealingService:
 		use_cloud: bool = False,
 		on_step_recorded: Optional[StepRecordedCallback] = None,
 		on_status_update: Optional[StatusUpdateCallback] = None,
+		batch_size: int = 1,
+		flush_interval: float = 0.5,
 	) -> WorkflowDefinitionSchema:
 		"""
 		Generate a workflow definition from a prompt by:
@@ -445,7 +572,12 @@ class HealingService:
 				- extracted_data: Optional[dict] (for extract steps)
 				- timestamp: str (ISO 8601 timestamp)
 				- target_text: Optional[str] (element text being interacted with)
+				May be an async function; pass it as is (no create_task wrapper needed), each call is
+				scheduled as a task on the running loop.
 			on_status_update: Optional callback for non-step status updates
+			batch_size: Steps coalesced into one on_step_recorded call. With the default of 1 the callback
+				receives one step dict per call; above 1 it receives a list of step dicts instead.
+			flush_interval: Seconds after which a partial batch is delivered anyway (only used when batch_size > 1)
 		"""
 
 		browser = Browser(use_cloud=use_cloud)
@@ -460,6 +592,12 @@ class HealingService:
 		# Track step count for callbacks
 		step_counter = {'count': 0}
 
+		# Coalesce steps into batches when requested; the controller then just queues each step
+		step_batcher = None
+		if on_step_recorded and batch_size > 1:
+			step_batcher = _StepBatcher(on_step_recorded, batch_size, flush_interval)
+			on_step_recorded = step_batcher.add
+
 		# Create a custom controller that captures element mappings
 		from browser_use import Controller
 
@@ -474,6 +612,10 @@ class HealingService:
 				super().__init__()
 				self.selector_generator = selector_generator
 				self.on_step_recorded = on_step_recorded
+				# Checked once here rather than per step
+				self._step_callback_is_async = inspect.iscoroutinefunction(on_step_recorded)
+				# Strong references to in-flight async callback tasks, so they are not garbage collected early
+				self._callback_tasks: set[asyncio.Task] = set()
 
 			async def act(self, action, browser_session, *args, **kwargs):
 				# Get the selector map before action
@@ -742,12 +884,15 @@ class HealingService:
 							'url': current_url,
 							'selector': selector,
 							'extracted_data': extracted_data,
-							'timestamp': datetime.now(timezone.utc).isoformat(),
+							'timestamp': _now_iso(),
 							'target_text': target_text,
 						}
 
-						# Fire the callback
-						self.on_step_recorded(callback_data)
+						# Fire the callback; async callbacks run as tasks so recording doesn't wait on them
+						if self._step_callback_is_async:
+							_schedule_callback(self.on_step_recorded(callback_data), self._callback_tasks)
+						else:
+							self.on_step_recorded(callback_data)
 
 					except Exception as e:
 						print(f'⚠️  Warning: Failed to fire step recorded callback: {e}')
@@ -758,28 +903,7 @@ class HealingService:
 				self, action_type: Optional[str], target_text: Optional[str], input_value: Optional[str], url: str
 			) -> str:
 				"""Generate a human-readable description of the action."""
-				if action_type == 'navigation':
-					return f'Navigate to {url}'
-				elif action_type == 'click':
-					if target_text:
-						return f'Click on "{target_text}"'
-					return 'Click element'
-				elif action_type == 'input_text':
-					if target_text and input_value:
-						return f'Enter "{input_value}" into {target_text}'
-					elif input_value:
-						return f'Enter text: {input_value}'
-					return 'Input text'
-				elif action_type == 'extract':
-					return 'Extract page content'
-				elif action_type == 'keypress':
-					if input_value:
-						return f'Press keys: {input_value}'
-					return 'Press keys'
-				elif action_type == 'scroll':
-					return 'Scroll page'
-				else:
-					return f'Execute action: {action_type or "unknown"}'
+				return _describe_action(action_type, target_text, input_value, url)
 
 		# Enhance the prompt to ensure agent mentions visible text of elements in a structured format
 		enhanced_prompt = f"""{prompt}
@@ -803,14 +927,13 @@ This structured format is critical for generating a reusable workflow."""
 		if on_status_update:
 			on_status_update('Creating browser agent...')
 
+		controller = CapturingController(self.selector_generator, on_step_recorded=on_step_recorded)
 		agent = Agent(
 			task=enhanced_prompt,
 			browser_session=browser,
 			llm=agent_llm,
 			page_extraction_llm=extraction_llm,
-			controller=CapturingController(
-				self.selector_generator, on_step_recorded=on_step_recorded
-			),  # Pass callbacks to controller
+			controller=controller,  # Pass callbacks to controller
 			enable_memory=False,
 			use_vision=True,
 			max_failures=10,
@@ -824,7 +947,15 @@ This structured format is critical for generating a reusable workflow."""
 			on_status_update('Recording workflow steps...')
 
 		print('🎬 Starting agent with element capture enabled...')
-		history = await agent.run()
+		if step_batcher:
+			step_batcher.start()
+		try:
+			history = await agent.run()
+		finally:
+			# Let async step callbacks still in flight finish; their errors are reported as they complete
+			await asyncio.gather(*controller._callback_tasks, return_exceptions=True)
+			if step_batcher:
+				await step_batcher.close()
 		print(f'✅ Agent completed. Captured {len(element_text_map)} element mappings total.')
 
 		if on_status_update:
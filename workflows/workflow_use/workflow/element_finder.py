@@ -8,15 +8,40 @@ Uses semantic strategies with XPath fallback.
 Leverages browser-use's existing semantic finding through the controller.
 """
 
+import functools
 import logging
+import sys
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from workflow_use.workflow.error_reporter import StrategyAttempt
 
+try:
+	from rapidfuzz import fuzz, process
+except ImportError:
+	fuzz = None
+	process = None
+
 logger = logging.getLogger(__name__)
 
 
+def _str_attr(node: Any, attr: str) -> str:
+	"""Read a string attribute from a dict or object node, '' when missing or not a string."""
+	value = node.get(attr) if isinstance(node, dict) else getattr(node, attr, None)
+	return value if isinstance(value, str) else ''
+
+
+def _positions(column: List[str], value: str):
+	"""Yield every position in `column` equal to `value`, using list.index for the scan."""
+	i = -1
+	try:
+		while True:
+			i = column.index(value, i + 1)
+			yield i
+	except ValueError:
+		return
+
+
 class ElementFinder:
 	"""
 	Find elements using multiple semantic fallback strategies.
@@ -26,6 +51,25 @@ class ElementFinder:
 	provide a faster path when we have semantic hints from workflow recording.
 	"""
 
+	def __init__(self):
+		# Column snapshot of the last selector map seen, see _snapshot()
+		self._snapshot_columns: Dict[str, list] = {'indices': [], 'nodes': []}
+
+		# Semantic strategy type -> finder yielding matching snapshot positions, bound once per instance
+		self._semantic_finders = {
+			'text_exact': self._find_by_text_exact,
+			'role_text': self._find_by_role_text,
+			'aria_label': self._find_by_aria_label,
+			'placeholder': self._find_by_placeholder,
+			'title': self._find_by_title,
+			'alt_text': self._find_by_alt_text,
+			'text_fuzzy': self._find_by_fuzzy_text,
+		}
+
+		# Matching positions per (strategy type, value, metadata) for the current snapshot;
+		# cleared whenever the snapshot is rebuilt
+		self._scan = functools.lru_cache(maxsize=1024)(self._scan_snapshot)
+
 	async def find_element_with_strategies(
 		self, strategies: List[Dict[str, Any]], browser_session: Any, target_text: Optional[str] = None
 	) -> Tuple[Optional[tuple[int, Dict[str, Any]]], List[StrategyAttempt]]:
@@ -110,15 +154,7 @@ class ElementFinder:
 						logger.debug(f'         ⏭️  {error_msg}')
 
 				# Try semantic strategies using selector map
-				elif selector_map and strategy_type in [
-					'text_exact',
-					'role_text',
-					'aria_label',
-					'placeholder',
-					'title',
-					'alt_text',
-					'text_fuzzy',
-				]:
+				elif selector_map and strategy_type in self._semantic_finders:
 					result = await self._find_with_semantic_strategy(
 						strategy_type, strategy_value, metadata, selector_map, target_text
 					)
@@ -168,6 +204,51 @@ class ElementFinder:
 		logger.warning(f'      ❌ All {len(sorted_strategies)} strategies failed')
 		return None, strategy_attempts
 
+	def _snapshot(self, selector_map: Dict[str, Any]) -> Dict[str, list]:
+		"""
+		Column-wise view of the selector map, rebuilt whenever its contents differ from the last one seen.
+
+		Each semantic strategy then scans one list of strings instead of fetching
+		attributes node by node. Columns hold the stripped attribute strings ('' when
+		missing) and line up with the 'indices' and 'nodes' columns.
+
+		browser-use hands back its own cached selector map dict and updates it in place, so the
+		snapshot is reused only when every (index, node) pair is unchanged, not merely the same dict.
+
+		Args:
+		    selector_map: Browser-use's selector map (dict of index -> element)
+
+		Returns:
+		    Dict of column name -> list, one entry per element
+		"""
+		columns = self._snapshot_columns
+		if len(selector_map) == len(columns['indices']) and all(
+			index == known_index and node is known_node
+			for (index, node), known_index, known_node in zip(selector_map.items(), columns['indices'], columns['nodes'])
+		):
+			return columns
+
+		columns = {name: [] for name in ('indices', 'nodes', 'text', 'role', 'aria_label', 'placeholder', 'title', 'alt')}
+		for index, node in selector_map.items():
+			columns['indices'].append(index)
+			columns['nodes'].append(node)
+			columns['text'].append(_str_attr(node, 'text').strip())
+			# Short label-like values repeat across the page and are compared against interned
+			# strategy values, so interning them lets most equality checks succeed on identity
+			for name in ('aria_label', 'placeholder', 'title', 'alt'):
+				columns[name].append(sys.intern(_str_attr(node, name).strip()))
+			# Role falls back to the tag name, compared case-insensitively
+			columns['role'].append(sys.intern((_str_attr(node, 'role') or _str_attr(node, 'tag_name')).lower()))
+
+		self._snapshot_columns = columns
+		self._scan.cache_clear()
+		return columns
+
+	def _scan_snapshot(self, strategy_type: str, value: str, metadata_items: Tuple[Tuple[str, Any], ...]) -> Tuple[int, ...]:
+		"""Positions in the current snapshot matching one strategy, in DOM order (memoized as self._scan)."""
+		finder = self._semantic_finders[strategy_type]
+		return tuple(finder(value, dict(metadata_items), self._snapshot_columns))
+
 	async def _find_with_semantic_strategy(
 		self,
 		strategy_type: str,
@@ -190,20 +271,25 @@ class ElementFinder:
 		    Tuple of (element_index, element_data) if found, None otherwise
 		"""
 		try:
-			# Iterate through selector map to find matching element
-			for index, element in selector_map.items():
-				# Handle both dict and object formats
-				if isinstance(element, dict):
-					node = element
-				else:
-					# Convert object to dict-like access
-					node = element
+			finder = self._semantic_finders.get(strategy_type)
+			if finder is None:
+				# XPath and CSS strategies are handled separately in find_element_with_strategies
+				return None
 
-				# Check if element matches the strategy
-				if await self._matches_strategy(node, strategy_type, strategy_value, metadata):
-					# Validate element exists and is visible
-					if await self._validate_element_in_map(index, node, target_text):
-						return (int(index), node)
+			snapshot = self._snapshot(selector_map)
+			strategy_value = sys.intern(strategy_value)
+			try:
+				positions = self._scan(strategy_type, strategy_value, tuple(sorted(metadata.items())))
+			except TypeError:
+				# Unhashable metadata values cannot be part of the cache key
+				positions = finder(strategy_value, metadata, snapshot)
+
+			indices = snapshot['indices']
+			nodes = snapshot['nodes']
+			for i in positions:
+				# Validate element exists and is visible
+				if await self._validate_element_in_map(indices[i], nodes[i], target_text):
+					return (int(indices[i]), nodes[i])
 
 			return None
 
@@ -211,6 +297,31 @@ class ElementFinder:
 			logger.debug(f'Error finding element with semantic strategy: {e}')
 			return None
 
+	# Semantic strategy finders: each returns the snapshot positions matching the strategy, in DOM order
+
+	def _find_by_text_exact(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		return _positions(snapshot['text'], value)
+
+	def _find_by_role_text(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		expected_role = sys.intern(metadata.get('role', '').lower())
+		roles = snapshot['role']
+		return (i for i in _positions(snapshot['text'], value) if roles[i] == expected_role)
+
+	def _find_by_aria_label(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		return _positions(snapshot['aria_label'], value)
+
+	def _find_by_placeholder(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		return _positions(snapshot['placeholder'], value)
+
+	def _find_by_title(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		return _positions(snapshot['title'], value)
+
+	def _find_by_alt_text(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		return _positions(snapshot['alt'], value)
+
+	def _find_by_fuzzy_text(self, value: str, metadata: Dict[str, Any], snapshot: Dict[str, list]) -> Iterable[int]:
+		return self._fuzzy_positions(value, snapshot['text'], metadata.get('threshold', 0.8))
+
 	async def _validate_element_in_map(self, index: int, node: Any, target_text: Optional[str] = None) -> bool:
 		"""
 		Validate that element in selector map is visible and optionally matches target_text.
@@ -289,75 +400,6 @@ class ElementFinder:
 			logger.debug(f'Error validating element at index {index}: {e}')
 			return False
 
-	async def _matches_strategy(self, node: Any, strategy_type: str, value: str, metadata: Dict[str, Any]) -> bool:
-		"""
-		Check if a DOM node matches a semantic strategy.
-
-		Args:
-		    node: EnhancedDOMTreeNode from browser-use (dict or object)
-		    strategy_type: Type of strategy (text_exact, role_text, etc.)
-		    value: Value to match
-		    metadata: Additional matching metadata
-
-		Returns:
-		    True if node matches the strategy
-		"""
-		try:
-			# Helper to get attribute from dict or object
-			def get_attr(obj, attr, default=''):
-				if isinstance(obj, dict):
-					return obj.get(attr, default)
-				return getattr(obj, attr, default)
-
-			# Semantic Strategy 1: Exact text match
-			if strategy_type == 'text_exact':
-				node_text = get_attr(node, 'text', '') or ''
-				return node_text.strip() == value
-
-			# Semantic Strategy 2: Role + text
-			elif strategy_type == 'role_text':
-				expected_role = metadata.get('role', '').lower()
-				node_role = get_attr(node, 'role', '') or get_attr(node, 'tag_name', '')
-				node_role = node_role.lower() if node_role else ''
-				node_text = get_attr(node, 'text', '') or ''
-
-				return node_role == expected_role and node_text.strip() == value
-
-			# Semantic Strategy 3: ARIA label
-			elif strategy_type == 'aria_label':
-				aria_label = get_attr(node, 'aria_label', '') or ''
-				return aria_label.strip() == value
-
-			# Semantic Strategy 4: Placeholder
-			elif strategy_type == 'placeholder':
-				placeholder = get_attr(node, 'placeholder', '') or ''
-				return placeholder.strip() == value
-
-			# Semantic Strategy 5: Title attribute
-			elif strategy_type == 'title':
-				title = get_attr(node, 'title', '') or ''
-				return title.strip() == value
-
-			# Semantic Strategy 6: Alt text (images)
-			elif strategy_type == 'alt_text':
-				alt = get_attr(node, 'alt', '') or ''
-				return alt.strip() == value
-
-			# Semantic Strategy 7: Fuzzy text match
-			elif strategy_type == 'text_fuzzy':
-				threshold = metadata.get('threshold', 0.8)
-				node_text = get_attr(node, 'text', '') or ''
-				return self._fuzzy_match(value, node_text.strip(), threshold)
-
-			# Note: XPath and CSS strategies are handled separately in find_element_with_strategies
-			# They cannot be matched against browser-use's node representation
-
-		except Exception as e:
-			logger.debug(f'Error matching strategy: {e}')
-			return False
-
-		return False
-
 	async def _validate_element_exists(
 		self, index: int, node: Any, browser_session: Any, target_text: Optional[str] = None
 	) -> bool:
@@ -597,6 +639,8 @@ class ElementFinder:
 		"""
 		Check if two strings match with fuzzy matching.
 
+		Uses RapidFuzz when it is installed, difflib otherwise.
+
 		Args:
 		    target: The target string to match
 		    candidate: The candidate string to check
@@ -605,5 +649,20 @@ class ElementFinder:
 		Returns:
 		    True if similarity >= threshold
 		"""
+		if fuzz is not None:
+			return fuzz.ratio(target.lower(), candidate.lower()) / 100.0 >= threshold
 		ratio = SequenceMatcher(None, target.lower(), candidate.lower()).ratio()
 		return ratio >= threshold
+
+	def _fuzzy_positions(self, target: str, candidates: List[str], threshold: float = 0.8) -> List[int]:
+		"""
+		Positions of all candidates that fuzzy-match target, in list order.
+
+		With RapidFuzz the whole column is scored in a single call.
+		"""
+		if process is not None:
+			matches = process.extract(
+				target, candidates, scorer=fuzz.ratio, processor=str.lower, limit=None, score_cutoff=threshold * 100
+			)
+			return sorted(position for _, _, position in matches)
+		return [i for i, candidate in enumerate(candidates) if self._fuzzy_match(target, candidate, threshold)]
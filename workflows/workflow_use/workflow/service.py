@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, TypeVar
 from typing import cast as _cast
 
 import yaml
@@ -29,13 +31,73 @@ from workflow_use.workflow.prompts import AGENT_STEP_SYSTEM_PROMPT, STRUCTURED_O
 from workflow_use.workflow.step_agent.controller import WorkflowStepAgentController
 from workflow_use.workflow.views import WorkflowRunOutput
 
+try:
+	from orjson import loads as _json_loads
+except ImportError:
+	from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 WAIT_FOR_ELEMENT_TIMEOUT = 2500
 
+# Actions that take no parameters (browser-use NoParamsAction)
+EMPTY_ACTIONS = frozenset({'go_back', 'go_forward'})
+
+# Actions after which the page is given time to stabilize
+ACTIONS_REQUIRING_WAIT = frozenset({'navigation', 'click', 'go_back', 'go_forward'})
+
+# Actions whose element can be located through semantic selector strategies
+MULTI_STRATEGY_ACTIONS = frozenset({'click', 'input'})
+
+# Workflow-only step fields that are not parameters of the browser-use action
+# Note: 'type' is NOT included because some actions (like navigation) need it in their params
+_WORKFLOW_METADATA_FIELDS = frozenset(
+	{
+		'description',
+		'output',
+		'agent_reasoning',
+		'page_context_url',
+		'page_context_title',
+		'cssSelector',
+		'xpath',
+		'elementTag',
+		'elementHash',  # These are workflow-specific selector fields
+		'selectorStrategies',  # Multi-strategy selectors
+		'target_text',
+		'container_hint',
+		'position_hint',
+		'interaction_type',  # Semantic workflow fields
+	}
+)
+
 T = TypeVar('T', bound=BaseModel)
 
 
+def _coerce_action_params(action_name: str, params: Dict[str, Any]) -> Dict[str, Any] | NoParamsAction:
+	"""Params to build the browser-use action with; actions that take none get an empty NoParamsAction instead of {}."""
+	if action_name in EMPTY_ACTIONS:
+		return NoParamsAction()
+	return params
+
+
+def _needs_multi_strategy(action_name: str, all_params: Dict[str, Any]) -> bool:
+	"""Whether a step should locate its element through the semantic selector strategies."""
+	return action_name in MULTI_STRATEGY_ACTIONS and bool(all_params.get('selectorStrategies'))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_workflow_file(file_path: str, mtime_ns: int, size: int) -> WorkflowDefinitionSchema:
+	"""Parse and validate a workflow file; memoized on (path, mtime, size) so an unchanged file is parsed once."""
+	if file_path.endswith('.json'):
+		# Recordings are JSON; parse the raw bytes directly instead of going through the YAML loader
+		with open(file_path, 'rb') as f:
+			data = _json_loads(f.read())
+	else:
+		with open(file_path, 'r', encoding='utf-8') as f:
+			data = yaml.safe_load(f)
+	return WorkflowDefinitionSchema(**data)
+
+
 class Workflow:
 	"""Simple orchestrator that executes a list of workflow *steps* defined in a WorkflowDefinitionSchema."""
 
@@ -52,6 +114,7 @@ class Workflow:
 		debug: bool = False,
 		debug_log_folder: str | Path | None = None,
 		step_wait_time: float | None = None,
+		sleep_fn: Callable[[float], Awaitable[Any]] = asyncio.sleep,
 	) -> None:
 		"""Initialize a new Workflow instance from a schema object.
 
@@ -65,6 +128,7 @@ class Workflow:
 			debug: Whether to enable debug mode (captures screenshots for each step)
 			debug_log_folder: Custom folder path for debug logs and screenshots (default: ./logs/workflow_debug)
 			step_wait_time: Time to wait between steps in seconds (default: uses workflow's default_wait_time or 0.1)
+			sleep_fn: Coroutine function used for the wait between steps (default: asyncio.sleep)
 
 		Raises:
 			ValueError: If the workflow schema is invalid (though Pydantic handles most).
@@ -95,6 +159,7 @@ class Workflow:
 			self.step_wait_time = workflow_schema.default_wait_time
 		else:
 			self.step_wait_time = 0.1
+		self.sleep_fn = sleep_fn
 
 		# Initialize multi-strategy element finder
 		self.element_finder = ElementFinder()
@@ -120,9 +185,9 @@ class Workflow:
 		step_wait_time: float = 0.1,
 	) -> Workflow:
 		"""Load a workflow from a file."""
-		with open(file_path, 'r', encoding='utf-8') as f:
-			data = yaml.safe_load(f)
-		workflow_schema = WorkflowDefinitionSchema(**data)
+		stat = os.stat(file_path)
+		# The cached schema is shared, so each workflow gets its own copy to mutate
+		workflow_schema = _parse_workflow_file(os.fspath(file_path), stat.st_mtime_ns, stat.st_size).model_copy(deep=True)
 		return Workflow(
 			workflow_schema=workflow_schema,
 			controller=controller,
@@ -142,30 +207,11 @@ class Workflow:
 		action_name: str = step.type  # Expect 'action' key for deterministic steps
 		all_params: Dict[str, Any] = step.model_dump(exclude_none=True)  # Exclude None values to prevent validation errors
 
-		# Filter out workflow metadata fields that shouldn't be passed to browser-use ActionModel
-		# Note: 'type' is NOT filtered here because some actions (like navigation) need it in their params
-		workflow_metadata_fields = {
-			'description',
-			'output',
-			'agent_reasoning',
-			'page_context_url',
-			'page_context_title',
-			'cssSelector',
-			'xpath',
-			'elementTag',
-			'elementHash',  # These are workflow-specific selector fields
-			'selectorStrategies',  # Multi-strategy selectors
-			'target_text',
-			'container_hint',
-			'position_hint',
-			'interaction_type',  # Semantic workflow fields
-		}
-
-		# Keep only action-specific parameters
-		params = {k: v for k, v in all_params.items() if k not in workflow_metadata_fields}
+		# Keep only action-specific parameters (workflow metadata fields aren't passed to browser-use ActionModel)
+		params = {k: v for k, v in all_params.items() if k not in _WORKFLOW_METADATA_FIELDS}
 
 		# Try multi-strategy element finding for click and input actions
-		if action_name in ['click', 'input'] and all_params.get('selectorStrategies'):
+		if _needs_multi_strategy(action_name, all_params):
 			try:
 				strategies = all_params['selectorStrategies']
 				target_text = all_params.get('target_text')  # Get target_text for validation
@@ -228,14 +274,12 @@ class Workflow:
 
 		# Special handling for actions that don't accept any parameters
 		# These actions use NoParamsAction, so we pass an empty instance instead of {}
-		empty_actions = {'go_back', 'go_forward'}
-		if action_name in empty_actions:
-			params = NoParamsAction()  # type: ignore
+		params = _coerce_action_params(action_name, params)  # type: ignore
 
 		ActionModel = self.controller.registry.create_action_model(include_actions=[action_name])
 		# Pass the params dictionary directly
 		# For empty actions, ActionModel itself IS the action (EmptyActionModel), so don't wrap in dict
-		if action_name in empty_actions:
+		if action_name in EMPTY_ACTIONS:
 			action_model = ActionModel()
 		else:
 			action_model = ActionModel(**{action_name: params})
@@ -246,8 +290,7 @@ class Workflow:
 			raise RuntimeError(f"Deterministic action '{action_name}' failed: {str(e)}")
 
 		# Wait for page to stabilize after certain actions
-		actions_requiring_wait = {'navigation', 'click', 'go_back', 'go_forward'}
-		if action_name in actions_requiring_wait:
+		if action_name in ACTIONS_REQUIRING_WAIT:
 			try:
 				page = await self.browser.get_current_page()
 				# Wait for network to be idle (no more than 2 connections for at least 500ms)
@@ -896,7 +939,7 @@ Extracted Information:"""
 					previous_step = self.schema.steps[step_index - 1]
 					step_wait_time_value = getattr(previous_step, 'wait_time', None)
 					wait_time = step_wait_time_value if step_wait_time_value is not None else self.step_wait_time
-					await asyncio.sleep(wait_time)
+					await self.sleep_fn(wait_time)
 					if wait_time > 0:
 						logger.debug(f'Waited {wait_time}s between steps')
 
@@ -1087,7 +1130,7 @@ Extract the values from the user's prompt and return them in the required format
 					previous_step = self.schema.steps[step_index - 1]
 					step_wait_time_value = getattr(previous_step, 'wait_time', None)
 					wait_time = step_wait_time_value if step_wait_time_value is not None else self.step_wait_time
-					await asyncio.sleep(wait_time)
+					await self.sleep_fn(wait_time)
 					if wait_time > 0:
 						logger.debug(f'Waited {wait_time}s between steps')
 